@@ -1,7 +1,7 @@
 # src/example/create_file.py
 
+import csv
 import os
-import pandas as pd
 import time
 
 # Define the folder where files will be created
@@ -20,15 +20,17 @@ def create_csv_file():
     """
     Creates a sample CSV file in the monitored folder.
     """
-    csv_data = {
-        "name": ["Alice", "Bob", "Charlie"],
-        "age": [25, 30, 35],
-        "city": ["New York", "San Francisco", "Los Angeles"]
-    }
-    df_csv = pd.DataFrame(csv_data)
+    csv_rows = [
+        ("Alice", 25, "New York"),
+        ("Bob", 30, "San Francisco"),
+        ("Charlie", 35, "Los Angeles")
+    ]
     timestamp = int(time.time())
     csv_file_path = os.path.join(TEST_FOLDER, f"sample_{timestamp}.csv")
-    df_csv.to_csv(csv_file_path, index=False)
+    with open(csv_file_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "age", "city"])
+        writer.writerows(csv_rows)
     print(f"Sample CSV file created at: {csv_file_path}")
 
 
@@ -36,6 +38,9 @@ def create_excel_file():
     """
     Creates a sample Excel file in the monitored folder.
     """
+    # pandas is only needed for the Excel writer, so import it here
+    import pandas as pd
+
     excel_data = {
         "product": ["A", "B", "C"],
         "price": [100, 200, 300],
@@ -2,28 +2,39 @@
 
 import os
 import argparse
+import asyncio
+import functools
 from dotenv import load_dotenv
 from src.handlers.files_monitor import FolderMonitor
-from src.handlers.db_handlers.mongo_handler import MongoDBHandler
-from src.handlers.db_handlers.postgres_handler import PostgresHandler
-from src.handlers.db_handlers.snowflake_handler import SnowflakeHandler
 from src.handlers.file_fetch_handlers.csv_fetch_handler import CSVFetchHandler
 from src.handlers.file_fetch_handlers.excel_fetch_handler import ExcelFetchHandler
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.handlers.file_fetch_handlers.fingerprint_index import FingerprintIndex
 from src.utils.logger import setup_logger
 
 
 # Set up argument parsing
-def parse_arguments():
+def _build_parser():
     parser = argparse.ArgumentParser(description="CLI Tool for Monitoring Files and Saving to Databases")
 
     parser.add_argument('--source', required=True, help="Folder path to monitor")
     parser.add_argument('--poll-interval', type=int, default=5, help="Polling interval in seconds")
-    parser.add_argument('--db', required=True, choices=['mongodb', 'postgresql', 'snowflake'], help="Database choice")
+    parser.add_argument('--db', required=True, nargs='+', choices=['mongodb', 'postgresql', 'snowflake'],
+                        help="Database choice; pass several to write to all of them in parallel")
     parser.add_argument('--env-file', default='.env', help="Path to .env file for configuration")
     parser.add_argument('--dry-run', action='store_true', help="Dry-run mode, only validate files without inserting data")
     parser.add_argument('--file-types', nargs='+', choices=['csv', 'excel'], help="File types to monitor (e.g. csv, excel)")
 
-    return parser.parse_args()
+    return parser
+
+
+# The parser is built once at import time and reused by every parse_arguments() call
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv=None):
+    return _PARSER.parse_args(argv)
 
 
 # Main function for setting up and running the folder monitor
@@ -37,47 +48,80 @@ def main():
     # Setup logger (log before folder validation to catch early issues)
     logger = setup_logger()
 
-    # Validate folder path
+    # Validate folder path: a single open() with O_DIRECTORY checks that it exists and is a directory
     folder_to_monitor = args.source
-    if not os.path.exists(folder_to_monitor):
-        logger.error(f"Folder {folder_to_monitor} does not exist.")
+    try:
+        dir_fd = os.open(folder_to_monitor, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        logger.error(f"Folder {folder_to_monitor} does not exist or is not a directory.")
         exit(1)
+    os.close(dir_fd)
 
     poll_interval = args.poll_interval
 
-    # Select the appropriate database handler based on CLI input
-    db_choice = args.db
-    db_handler = None
-    if db_choice == 'mongodb':
-        db_handler = MongoDBHandler()
-    elif db_choice == 'postgresql':
-        db_handler = PostgresHandler()
-    elif db_choice == 'snowflake':
-        db_handler = SnowflakeHandler()
+    # Select the appropriate database handlers based on CLI input (duplicates are ignored).
+    # Drivers are imported only for the databases requested, so an unused driver never costs start-up time.
+    db_choices = list(dict.fromkeys(args.db))
+    db_handlers = []
+    for db_choice in db_choices:
+        if db_choice == 'mongodb':
+            from src.handlers.db_handlers.mongo_handler import MongoDBHandler
+            db_handlers.append(MongoDBHandler())
+        elif db_choice == 'postgresql':
+            from src.handlers.db_handlers.postgres_handler import PostgresHandler
+            db_handlers.append(PostgresHandler())
+        elif db_choice == 'snowflake':
+            from src.handlers.db_handlers.snowflake_handler import SnowflakeHandler
+            db_handlers.append(SnowflakeHandler())
+
+    # Fan out to every selected database when more than one is requested
+    if len(db_handlers) == 1:
+        db_handler = db_handlers[0]
+    else:
+        from src.handlers.db_handlers.multi_db_handler import MultiDBHandler
+        db_handler = MultiDBHandler(db_handlers)
+
+    # CSVs are parsed 50k rows at a time and .xlsx workbooks are streamed in read-only mode,
+    # 10k rows at a time, instead of being loaded whole. Column types inferred for a CSV header
+    # are shared by every later file with the same header. Checksums of files arriving together
+    # are computed in parallel by one shared hasher, which skips files unchanged since they were hashed.
+    # A file with the same content as one already processed in this run is not processed again.
+    csv_schema_cache = {}
+    bulk_hasher = BulkHasher(checksum_cache=ChecksumCache())
+    fingerprints = FingerprintIndex()
+    csv_chunked_handler = functools.partial(CSVFetchHandler, chunk_rows=50_000, schema_cache=csv_schema_cache,
+                                            bulk_hasher=bulk_hasher, fingerprints=fingerprints)
+    excel_stream_handler = functools.partial(ExcelFetchHandler, chunk_rows=10_000, bulk_hasher=bulk_hasher,
+                                             fingerprints=fingerprints)
+    excel_handler = functools.partial(ExcelFetchHandler, bulk_hasher=bulk_hasher, fingerprints=fingerprints)
 
     # File handlers - allow CLI to specify which file types to monitor (new feature)
     file_handlers = {}
     if args.file_types:
         if 'csv' in args.file_types:
-            file_handlers['.csv'] = CSVFetchHandler
+            file_handlers['.csv'] = csv_chunked_handler
         if 'excel' in args.file_types:
-            file_handlers['.xls'] = ExcelFetchHandler
-            file_handlers['.xlsx'] = ExcelFetchHandler
+            file_handlers['.xls'] = excel_handler
+            file_handlers['.xlsx'] = excel_stream_handler
     else:
         # Default to CSV and Excel if no specific file types are provided
         file_handlers = {
-            '.csv': CSVFetchHandler,
-            '.xls': ExcelFetchHandler,
-            '.xlsx': ExcelFetchHandler
+            '.csv': csv_chunked_handler,
+            '.xls': excel_handler,
+            '.xlsx': excel_stream_handler
         }
 
     logger.info(f"Monitoring folder: {folder_to_monitor} with polling interval {poll_interval} seconds.")
-    logger.info(f"Saving data to {db_choice} database.")
+    logger.info(f"Saving data to {', '.join(db_choices)} database(s).")
     logger.info(f"File types being monitored: {', '.join(file_handlers.keys())}")
 
     # Start the folder monitoring process with dynamic file handlers
     folder_monitor = FolderMonitor(folder_to_monitor, poll_interval, db_handler, dry_run=args.dry_run, file_handlers=file_handlers)
-    folder_monitor.start_monitoring()
+    try:
+        # On Ctrl-C the monitoring task is cancelled, which stops the observer and drains the queued writes
+        asyncio.run(folder_monitor.start_monitoring())
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
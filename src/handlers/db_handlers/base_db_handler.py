@@ -1,13 +1,211 @@
 # src/handlers/db_handlers/base_db_handler.py
 
+import functools
+import queue
+import threading
+import time
+import pandas as pd
 from abc import ABC, abstractmethod
 from src.utils.logger import setup_logger
 
 
+def df_to_rows(df):
+    """
+    Converts a DataFrame into row tuples with a single vectorized conversion.
+
+    ``to_numpy`` walks the frame once column-wise and ``tolist`` unboxes the values into native
+    Python scalars, avoiding the per-row Series construction of ``DataFrame.iterrows``.
+
+    :param df: The pandas DataFrame to be converted.
+    :type df: pandas.DataFrame
+    :return: An iterator of row tuples in column order.
+    :rtype: Iterator[tuple]
+    """
+    return map(tuple, df.to_numpy().tolist())
+
+
+class IngestWriter:
+    """
+    Background writer that drains a bounded queue of batches on a dedicated thread.
+
+    Producers call ``enqueue`` and return as soon as the batch is queued, so reading and
+    validating the next file overlaps with the network-bound database write. The bounded
+    queue applies backpressure when the database falls behind. A failed write is logged, and
+    the first failure is raised again by the next ``flush`` or ``close``, so the caller learns
+    that data was not saved.
+
+    DataFrames with the same columns that are queued within ``linger`` seconds of each other
+    are concatenated and written with one ``sink`` call, up to ``max_rows`` rows, so a burst
+    of small files costs one database round-trip instead of one per file.
+
+    :param sink: Callable invoked on the worker thread with each queued batch.
+    :type sink: Callable
+    :param maxsize: Maximum number of batches waiting to be written.
+    :type maxsize: int
+    :param max_rows: Row count after which coalesced DataFrames are written without waiting for more.
+    :type max_rows: int
+    :param linger: Seconds to wait for further DataFrames to coalesce with a queued one.
+    :type linger: float
+    """
+
+    _STOP = object()
+
+    def __init__(self, sink, maxsize: int = 8, max_rows: int = 50_000, linger: float = 0.02) -> None:
+        self.sink = sink
+        self.max_rows = max_rows
+        self.linger = linger
+        self.logger = setup_logger()
+        self._q = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._error_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="ingest-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, batch) -> None:
+        """
+        Queues a batch for writing, blocking only while the queue is full.
+        """
+        self._q.put(batch)
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued batch has been written.
+
+        :raises Exception: The first error a write raised since the last ``flush`` or ``close``.
+        """
+        self._q.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Writes the remaining batches and stops the worker thread.
+
+        :raises Exception: The first error a write raised since the last ``flush`` or ``close``.
+        """
+        self._q.put(self._STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self) -> None:
+        held = None
+        while True:
+            batch = held if held is not None else self._q.get()
+            held = None
+            if batch is self._STOP:
+                self._q.task_done()
+                return
+            batches = [batch]
+            if isinstance(batch, pd.DataFrame):
+                # Coalesce the DataFrames queued right behind this one; a batch that cannot be
+                # merged is held back and written next, so the order of writes is kept
+                rows = len(batch)
+                deadline = time.monotonic() + self.linger
+                while rows < self.max_rows:
+                    try:
+                        following = self._q.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if not (isinstance(following, pd.DataFrame) and following.columns.equals(batch.columns)):
+                        held = following
+                        break
+                    batches.append(following)
+                    rows += len(following)
+            try:
+                self.sink(batch if len(batches) == 1 else pd.concat(batches, ignore_index=True))
+            except Exception as e:
+                self.logger.error(f"Background write failed: {e}")
+                with self._error_lock:
+                    if self._error is None:
+                        self._error = e
+            finally:
+                for _ in batches:
+                    self._q.task_done()
+
+
 class BaseDBHandler(ABC):
+    # Handlers that insert Python dicts set this, so callers holding records can enqueue them as-is
+    accepts_records = False
+
     def __init__(self):
         # Initialize the unified logger for all DB handlers
         self.logger = setup_logger()
+        self._writer = None
+        # Handlers are shared by the monitor's worker threads, which may all enqueue a first batch at once
+        self._writer_lock = threading.Lock()
+
+    @property
+    def writer(self) -> IngestWriter:
+        """
+        The background writer feeding ``save_data``, started on first use.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = IngestWriter(self._write)
+            return self._writer
+
+    def enqueue(self, df) -> None:
+        """
+        Queues a DataFrame to be saved by the background writer and returns immediately.
+
+        Handlers with ``accepts_records`` also take a list of dictionary records, which is passed
+        to ``insert_records`` instead of ``save_data``.
+
+        :param df: The pandas DataFrame to be saved, or a list of records.
+        :type df: pandas.DataFrame
+        """
+        self.writer.enqueue(df)
+
+    def _write(self, batch) -> None:
+        if isinstance(batch, pd.DataFrame):
+            self.save_data(batch)
+        else:
+            self.insert_records(batch)
+
+    def flush(self) -> None:
+        """
+        Waits until all queued DataFrames have been saved.
+
+        :raises Exception: The first error saving a queued batch raised since the last flush.
+        """
+        writer = self._writer
+        if writer is not None:
+            writer.flush()
+
+    def close(self) -> None:
+        """
+        Saves any queued DataFrames and stops the background writer.
+
+        :raises Exception: The first error saving a queued batch raised since the last flush.
+        """
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _prepare_insert(table, columns):
+        """
+        Builds the parameterized INSERT statement for a table and column order.
+
+        The statement is cached, so a monitor feeding many files with the same schema builds
+        it only once.
+
+        :param table: Name of the target table.
+        :type table: str
+        :param columns: Column names in insertion order.
+        :type columns: tuple of str
+        :return: The ``INSERT INTO ... VALUES (%s, ...)`` statement.
+        :rtype: str
+        """
+        placeholders = ", ".join(["%s"] * len(columns))
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
 
     @abstractmethod
     def insert_records(self, records):
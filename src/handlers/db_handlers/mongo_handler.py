@@ -1,13 +1,51 @@
 # src/handlers/db_handlers/mongo_handler.py
 
+import functools
+import importlib.util
+import itertools
+import bson
+import pyarrow as pa
 import pymongo
 import os
-from dotenv import load_dotenv
+from pymongo.errors import CollectionInvalid
+from pymongo.write_concern import WriteConcern
 from src.handlers.db_handlers.base_db_handler import BaseDBHandler
-import pandas as pd
 
-# Load environment variables from the .env file
-load_dotenv()
+
+@functools.lru_cache(maxsize=4)
+def _get_client(mongo_uri):
+    """
+    Returns a MongoClient shared by every handler connecting to the same URI.
+
+    Building a client starts a connection pool and monitor threads and resolves the topology,
+    so it is done once per URI instead of once per handler instance.
+
+    :param mongo_uri: The MongoDB connection URI.
+    :type mongo_uri: str
+    :return: The cached client for the URI.
+    :rtype: pymongo.MongoClient
+    """
+    return pymongo.MongoClient(
+        mongo_uri,
+        maxPoolSize=32,
+        compressors=_wire_compressors(),
+        zlibCompressionLevel=3
+    )
+
+
+def _wire_compressors():
+    """
+    Lists the wire compressors to negotiate with the server, fastest first.
+
+    zstd and snappy are only offered when their optional modules are installed; zlib is always
+    available.
+
+    :return: Comma-separated compressor names for the ``compressors`` client option.
+    :rtype: str
+    """
+    optional = [("zstd", "zstandard"), ("snappy", "snappy")]
+    compressors = [name for name, module in optional if importlib.util.find_spec(module)]
+    return ",".join(compressors + ["zlib"])
 
 
 class MongoDBHandler(BaseDBHandler):
@@ -20,29 +58,70 @@ class MongoDBHandler(BaseDBHandler):
     :param BaseDBHandler: Inherits from BaseDBHandler for logging and common database functionalities.
     """
 
+    # Number of documents sent per insert_many call
+    batch_size = 1000
+
+    # Documents are dicts, so validated records are inserted without a DataFrame round-trip
+    accepts_records = True
+
     def __init__(self):
         """
         Initializes the MongoDBHandler by setting up a connection to MongoDB using the provided URI.
+
+        When ``MONGODB_TIMESERIES_FIELD`` is set, the collection is created as a time series
+        collection keyed on that field, so append-only ingest is stored in buckets instead of
+        maintaining an index entry per document.
         """
         super().__init__()
         mongo_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
         mongo_database = os.getenv("MONGODB_DATABASE", "mydatabase")
         mongo_collection = os.getenv("MONGODB_COLLECTION", "mycollection")
+        timeseries_field = os.getenv("MONGODB_TIMESERIES_FIELD")
 
-        self.client = pymongo.MongoClient(mongo_uri)
+        if not bson.has_c():
+            self.logger.warning("pymongo's C extensions are not available; documents are encoded in pure Python.")
+        self.client = _get_client(mongo_uri)
         self.db = self.client[mongo_database]
-        self.collection = self.db[mongo_collection]
+        if timeseries_field:
+            self._create_timeseries_collection(mongo_collection, timeseries_field)
+        # Bulk ingest only needs the primary's acknowledgement, not a journal flush
+        self.collection = self.db.get_collection(mongo_collection, write_concern=WriteConcern(w=1, j=False))
+
+    def _create_timeseries_collection(self, name, time_field):
+        """
+        Creates the ingest collection as a time series collection if it does not exist yet.
+
+        :param name: Name of the collection.
+        :type name: str
+        :param time_field: Document field holding each record's timestamp.
+        :type time_field: str
+        """
+        granularity = os.getenv("MONGODB_TIMESERIES_GRANULARITY", "seconds")
+        try:
+            self.db.create_collection(name, timeseries={"timeField": time_field, "granularity": granularity})
+            self.logger.info(f"Created time series collection {name} on field {time_field}")
+        except CollectionInvalid:
+            # The collection already exists; keep using it as-is
+            pass
 
     def insert_records(self, records):
         """
         Inserts a list of dictionary records into the specified MongoDB collection.
 
-        :param records: List of dictionaries representing the records to be inserted.
+        Records are sent in unordered batches of ``batch_size`` documents, so the server can
+        apply each batch without ordering bookkeeping and no single BSON payload grows unbounded.
+
+        :param records: List (or any iterable) of dictionaries representing the records to be inserted.
         :type records: list of dict
         """
         try:
             self.logger.info(f"Inserting data into MongoDB collection {self.collection.name}")
-            self.collection.insert_many(records)
+            records = iter(records)
+            while True:
+                batch = list(itertools.islice(records, self.batch_size))
+                if not batch:
+                    break
+                self.collection.insert_many(batch, ordered=False)
             self.logger.info("Data successfully inserted into MongoDB")
         except Exception as e:
             self.logger.error(f"Failed to insert data into MongoDB: {str(e)}")
@@ -52,8 +131,39 @@ class MongoDBHandler(BaseDBHandler):
         """
         Converts a pandas DataFrame into dictionary records and inserts them into MongoDB.
 
+        Rows are converted ``chunk_size`` at a time and streamed into ``insert_records``, so only
+        one chunk of dictionaries is alive at once instead of the whole DataFrame.
+
         :param df: DataFrame to be converted and inserted into the database.
         :type df: pandas.DataFrame
         """
-        records = df.to_dict(orient="records")
+        records = itertools.chain.from_iterable(self._iter_chunks(df))
         self.insert_records(records)
+
+    @staticmethod
+    def _iter_chunks(df, chunk_size=5000):
+        """
+        Yields the DataFrame as successive lists of dictionary records.
+
+        The DataFrame is converted to an Arrow table once, which reuses the buffers of numeric
+        and Arrow-backed columns, and each record batch's C++ ``to_pylist`` builds the documents
+        without pandas' per-cell Python boxing. Its values are native Python scalars, which
+        pymongo's C encoder handles directly, and missing values become ``None``. DataFrames with
+        dtypes Arrow cannot represent (e.g. mixed-type object columns) fall back to
+        ``DataFrame.to_dict``, chunk by chunk.
+
+        :param df: DataFrame to be converted.
+        :type df: pandas.DataFrame
+        :param chunk_size: Maximum number of rows converted per chunk.
+        :type chunk_size: int
+        """
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            for start in range(0, len(df), chunk_size):
+                chunk = df.iloc[start:start + chunk_size]
+                # Missing values become None, as with Arrow, instead of float NaN
+                yield chunk.astype(object).where(chunk.notna(), None).to_dict(orient="records")
+            return
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            yield batch.to_pylist()
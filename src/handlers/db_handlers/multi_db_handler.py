@@ -0,0 +1,66 @@
+# src/handlers/db_handlers/multi_db_handler.py
+
+from concurrent.futures import ThreadPoolExecutor
+from src.handlers.db_handlers.base_db_handler import BaseDBHandler
+
+
+class MultiDBHandler(BaseDBHandler):
+    """
+    Fans every write out to several database handlers in parallel.
+
+    Database writes are network-bound, so running each target handler on its own thread lets
+    the inserts overlap instead of paying for each database one after another.
+
+    :param handlers: The database handlers that receive every write.
+    :type handlers: list of BaseDBHandler
+    """
+
+    def __init__(self, handlers):
+        """
+        Initializes the MultiDBHandler with a thread per target handler.
+
+        :param handlers: The database handlers that receive every write.
+        :type handlers: list of BaseDBHandler
+        """
+        super().__init__()
+        self.handlers = list(handlers)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.handlers), thread_name_prefix="db-fanout")
+
+    def save_data(self, df):
+        """
+        Saves the DataFrame to every target database concurrently.
+
+        :param df: The pandas DataFrame to be saved.
+        :type df: pandas.DataFrame
+        """
+        self._fan_out("save_data", df)
+
+    def insert_records(self, records):
+        """
+        Inserts the records into every target database concurrently.
+
+        :param records: The records to be inserted, in the format the target handlers expect.
+        :type records: list
+        """
+        # Materialize once so every handler can iterate the records
+        self._fan_out("insert_records", list(records))
+
+    def close(self):
+        """
+        Drains the queued writes, then closes every target handler and the fan-out threads.
+        """
+        try:
+            super().close()
+        finally:
+            for handler in self.handlers:
+                handler.close()
+            self._executor.shutdown()
+
+    def _fan_out(self, method_name, data):
+        self.logger.info(f"Writing data to {len(self.handlers)} databases in parallel")
+        futures = [self._executor.submit(getattr(handler, method_name), data) for handler in self.handlers]
+        # Wait for every handler; re-raise the first failure once all writes have finished
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
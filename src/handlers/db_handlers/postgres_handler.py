@@ -1,13 +1,10 @@
 # src/handlers/db_handlers/postgresql_handler.py
 
+import io
 import psycopg2
+import psycopg2.extras
 import os
-from dotenv import load_dotenv
 from src.handlers.db_handlers.base_db_handler import BaseDBHandler
-from src.utils.logger import setup_logger
-
-# Load environment variables
-load_dotenv()
 
 
 class PostgresHandler(BaseDBHandler):
@@ -33,39 +30,48 @@ class PostgresHandler(BaseDBHandler):
             port=os.getenv("POSTGRES_PORT")
         )
         self.cursor = self.connection.cursor()
-        self.logger = setup_logger()
 
     def save_data(self, df):
         """
         Inserts data from a DataFrame into a PostgreSQL database.
 
+        The DataFrame is serialized to CSV in memory and streamed to the server with a
+        single ``COPY ... FROM STDIN`` instead of one ``INSERT`` per row.
+
         :param df: DataFrame containing data to be inserted.
         :type df: pandas.DataFrame
         """
         try:
             self.logger.info("Inserting data into PostgreSQL")
-            insert_query = f"INSERT INTO {os.getenv('POSTGRES_TABLE')} VALUES (%s, %s, %s)"
-            for _, row in df.iterrows():
-                self.cursor.execute(insert_query, tuple(row.values))
+            buffer = io.StringIO()
+            df.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            copy_query = f"COPY {os.getenv('POSTGRES_TABLE')} FROM STDIN WITH CSV"
+            self.cursor.copy_expert(copy_query, buffer)
             self.connection.commit()
             self.logger.info("Data successfully inserted into PostgreSQL")
         except Exception as e:
             self.logger.error(f"Failed to insert data into PostgreSQL: {str(e)}")
             self.connection.rollback()
+            raise
 
     def insert_records(self, records):
         """
         Performs bulk insert of multiple records into a PostgreSQL table.
 
+        Records are bound as parameters and sent in pages of multi-row ``VALUES`` lists via
+        ``execute_values``, then committed once.
+
         :param records: List of records to be inserted, where each record is a tuple of values.
         :type records: list of tuples
         """
         try:
             self.logger.info("Inserting data into PostgreSQL")
-            insert_query = "INSERT INTO your_table (column1, column2, column3) VALUES (%s, %s, %s)"
-            self.cursor.executemany(insert_query, records)
+            insert_query = f"INSERT INTO {os.getenv('POSTGRES_TABLE')} VALUES %s"
+            psycopg2.extras.execute_values(self.cursor, insert_query, records, page_size=5000)
             self.connection.commit()
             self.logger.info("Data successfully inserted into PostgreSQL")
         except Exception as e:
             self.logger.error(f"Failed to insert data into PostgreSQL: {str(e)}")
             self.connection.rollback()
+            raise
@@ -1,13 +1,9 @@
 # src/handlers/db_handlers/snowflake_handler.py
 
 import snowflake.connector
+from snowflake.connector.pandas_tools import write_pandas
 import os
-from dotenv import load_dotenv
-from src.handlers.db_handlers.base_db_handler import BaseDBHandler
-from src.utils.logger import setup_logger
-
-# Load environment variables
-load_dotenv()
+from src.handlers.db_handlers.base_db_handler import BaseDBHandler, df_to_rows
 
 
 class SnowflakeHandler(BaseDBHandler):
@@ -21,6 +17,10 @@ class SnowflakeHandler(BaseDBHandler):
     :param BaseDBHandler: Provides initial logging setup and common handler functionalities.
     """
 
+    # DataFrames with fewer rows are inserted directly; staging files for COPY INTO has a
+    # fixed overhead that only pays off for larger loads
+    bulk_load_threshold = 5000
+
     def __init__(self):
         """
         Initializes the SnowflakeHandler with a connection to Snowflake using environment variables.
@@ -34,41 +34,82 @@ class SnowflakeHandler(BaseDBHandler):
             database=os.getenv("SNOWFLAKE_DATABASE"),
             schema=os.getenv("SNOWFLAKE_SCHEMA")
         )
-        self.logger = setup_logger()
 
     def save_data(self, df):
         """
         Saves data from a pandas DataFrame to Snowflake.
 
+        Uses ``write_pandas``, which stages the DataFrame as compressed Parquet files and loads
+        them with a single ``COPY INTO`` rather than issuing one ``INSERT`` per row. DataFrames
+        smaller than ``bulk_load_threshold`` rows skip the staging step and are sent as one
+        batched ``INSERT``.
+
+        :param df: DataFrame containing data to be inserted into Snowflake.
+        :type df: pandas.DataFrame
+        """
+        if len(df) < self.bulk_load_threshold:
+            self._insert_rows(df)
+            return
+        try:
+            self.logger.info("Inserting data into Snowflake")
+            success, nchunks, nrows, _ = write_pandas(
+                self.conn,
+                df,
+                os.getenv('SNOWFLAKE_TABLE'),
+                chunk_size=100_000,
+                compression='snappy',
+                parallel=4,
+                quote_identifiers=False
+            )
+            if not success:
+                raise RuntimeError(f"COPY INTO reported failure after loading {nrows} rows")
+            self.conn.commit()
+            self.logger.info(f"Data successfully inserted into Snowflake ({nrows} rows in {nchunks} chunks)")
+        except Exception as e:
+            self.logger.error(f"Failed to insert data into Snowflake: {str(e)}")
+            raise
+
+    def _insert_rows(self, df):
+        """
+        Inserts a small DataFrame with one batched INSERT statement.
+
         :param df: DataFrame containing data to be inserted into Snowflake.
         :type df: pandas.DataFrame
         """
         try:
             self.logger.info("Inserting data into Snowflake")
-            insert_query = f"INSERT INTO {os.getenv('SNOWFLAKE_TABLE')} VALUES (%s, %s, %s)"
+            insert_query = self._prepare_insert(os.getenv('SNOWFLAKE_TABLE'), tuple(df.columns))
             cursor = self.conn.cursor()
-            for _, row in df.iterrows():
-                cursor.execute(insert_query, tuple(row.values))
+            cursor.executemany(insert_query, list(df_to_rows(df)))
             cursor.close()
             self.conn.commit()
             self.logger.info("Data successfully inserted into Snowflake")
         except Exception as e:
             self.logger.error(f"Failed to insert data into Snowflake: {str(e)}")
+            raise
 
     def insert_records(self, records):
         """
-        Inserts a list of records into a Snowflake table.
+        Inserts a list of records into the Snowflake table with one batched INSERT statement.
+
+        Like ``PostgresHandler.insert_records``, the values of each record are inserted in the
+        table's column order.
 
         :param records: List of tuples, each tuple containing data for one record.
         :type records: list of tuples
         """
+        records = list(records)
+        if not records:
+            return
         try:
             self.logger.info("Inserting data into Snowflake")
+            placeholders = ", ".join(["%s"] * len(records[0]))
+            insert_query = f"INSERT INTO {os.getenv('SNOWFLAKE_TABLE')} VALUES ({placeholders})"
             cursor = self.conn.cursor()
-            insert_query = "INSERT INTO your_table (column1, column2, column3) VALUES (%s, %s, %s)"
             cursor.executemany(insert_query, records)
             cursor.close()
             self.conn.commit()
             self.logger.info("Data successfully inserted into Snowflake")
         except Exception as e:
-            self.logger.error(f"Failed to insert data into Snowflake: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"Failed to insert data into Snowflake: {str(e)}")
+            raise
@@ -1,13 +1,219 @@
 # handlers/file_handlers/base_file_fetch_handler.py
 
 from abc import ABC, abstractmethod
+import contextlib
+import dataclasses
+import functools
 import hashlib
-import time
+import io
+import itertools
+import multiprocessing
+import operator
 import os
-from src.utils.logger import setup_logger
-from pydantic import ValidationError
+import queue
+import sys
+import threading
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pandas as pd
-from typing import Optional, Tuple, List
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher, sha256_file
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.handlers.file_fetch_handlers.fingerprint_index import FingerprintIndex
+from src.models.frame_schema import FrameSchema
+from src.models.row_validator import compile_row_validator, uses_default_serialization
+from src.utils.file_ready import wait_until_stable
+from src.utils.logger import setup_logger
+from pydantic import BaseModel, ValidationError
+from typing import Callable, Iterator, Optional, Tuple, List
+
+# Threads hashing files while their chunks are parsed and validated.
+# File reads and hashlib release the GIL, so this I/O overlaps with validation.
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="file-io")
+
+# How validate_records turns rows into records, see BaseFileFetchHandler.__init__
+DATA_MODEL_MODES = ('strict', 'construct', 'dataclass')
+
+# Files up to this size are read into memory once, then hashed and parsed from that single read
+FUSED_READ_MAX_BYTES = 64 * 1024 * 1024
+
+# The same limit for handlers reading in chunks, which stream anything bigger than a few chunks
+FUSED_READ_CHUNKED_MAX_BYTES = 4 * 1024 * 1024
+
+# Invalid rows quoted in the single validation error logged per chunk
+INVALID_ROWS_SAMPLE = 10
+
+# Chunks parsed ahead of the one being validated, see read_ahead
+READ_AHEAD_CHUNKS = 4
+
+# Chunks with at least this many rows are validated with pydantic on several cores
+PARALLEL_VALIDATION_MIN_ROWS = 20_000
+
+
+def read_ahead(chunks: Iterator[pd.DataFrame], depth: int = READ_AHEAD_CHUNKS) -> Iterator[pd.DataFrame]:
+    """
+    Yield the chunks of an iterator while the following ones are parsed on a producer thread.
+
+    Up to `depth` parsed chunks wait in a bounded queue, so parsing keeps going while a slow
+    chunk is validated or written, without holding more than `depth` chunks in memory.
+
+    :param chunks: The chunk iterator, e.g. from `BaseFileFetchHandler.iter_chunks`.
+    :type chunks: Iterator[pd.DataFrame]
+    :param depth: Maximum number of chunks parsed ahead of the consumer.
+    :type depth: int
+    :return: An iterator of the same chunks in the same order.
+    :rtype: Iterator[pd.DataFrame]
+    """
+    done = object()
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for chunk in chunks:
+                buffer.put((chunk, None))
+                if stop.is_set():
+                    return
+            buffer.put((done, None))
+        except BaseException as e:
+            buffer.put((done, e))
+
+    # A dedicated thread rather than _IO_POOL: a producer blocked on a full queue must not
+    # take the thread a checksum that the consumer is waiting for would run on
+    producer = threading.Thread(target=produce, name="read-ahead", daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk, error = buffer.get()
+            if error is not None:
+                raise error
+            if chunk is done:
+                return
+            yield chunk
+    finally:
+        # Unblock and wait for the producer before closing the underlying reader
+        stop.set()
+        while producer.is_alive():
+            try:
+                buffer.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        producer.join()
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+def _validate_rows(data_model, records: List[dict]) -> Tuple[List[dict], List[Tuple[dict, str]], int]:
+    """
+    Validate records with a pydantic model. Module-level so it can run in worker processes.
+
+    Models `compile_row_validator` can handle are validated by its generated function, which
+    each worker process compiles once; other models go through pydantic. A row repeating an
+    earlier row of the batch, value for value, reuses that row's outcome instead of being
+    validated again, which pays off for files made of low-cardinality columns.
+
+    :return: The validated records, each invalid record with its validation error, and the
+        number of rows whose outcome was reused.
+    :rtype: Tuple[List[dict], List[Tuple[dict, str]], int]
+    """
+    validate = compile_row_validator(data_model)
+    if validate is not None:
+        invalid = (KeyError, TypeError, ValueError)
+    else:
+        dump = _record_dumper(data_model)
+
+        def validate(record):
+            return dump(data_model(**record))
+        invalid = ValidationError
+
+    validated_records = []
+    errors = []
+    outcomes = {}
+    reused = 0
+    for record in records:
+        values = tuple(record.values())
+        # The records of a batch share their columns; types are part of the key, as 1, 1.0 and True compare equal
+        key = (values, tuple(map(type, values)))
+        try:
+            outcome = outcomes.get(key)
+        except TypeError:
+            # Unhashable cell values, e.g. lists, are validated every time
+            key = outcome = None
+        if outcome is None:
+            try:
+                outcome = (validate(record), None)
+            except invalid as e:
+                outcome = (None, f"missing field {e}" if isinstance(e, KeyError) else str(e))
+            if key is not None:
+                outcomes[key] = outcome
+        else:
+            reused += 1
+
+        validated, error = outcome
+        if error is None:
+            validated_records.append(dict(validated))
+        else:
+            errors.append((record, error))
+    return validated_records, errors, reused
+
+
+@functools.lru_cache(maxsize=None)
+def _record_dumper(data_model) -> Callable:
+    """
+    Returns the function turning a validated model instance into a record dict.
+
+    A model whose fields hold no nested models or dataclasses, and whose dump is exactly its
+    field values, is copied from the instance's `__dict__`, which already holds the validated
+    values, instead of being walked field by field by `model_dump`.
+    """
+    def nests(annotation):
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return True
+        if dataclasses.is_dataclass(annotation):
+            return True
+        return any(nests(arg) for arg in typing.get_args(annotation))
+
+    if not uses_default_serialization(data_model):
+        return data_model.model_dump
+    if any(nests(field.annotation) for field in data_model.model_fields.values()):
+        return data_model.model_dump
+    return lambda instance: instance.__dict__.copy()
+
+
+_validation_pool_lock = threading.Lock()
+_validation_executor = None
+
+
+def _validation_pool() -> Executor:
+    """
+    Returns the pool validating large chunks, created on first use and shared by every handler.
+
+    Pydantic validation holds the GIL, so worker processes are used; on a free-threaded
+    interpreter threads scale just as well without pickling the records.
+    """
+    global _validation_executor
+    with _validation_pool_lock:
+        if _validation_executor is None:
+            workers = os.cpu_count() or 1
+            if getattr(sys, '_is_gil_enabled', lambda: True)() is False:
+                _validation_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validate")
+            else:
+                # Spawned workers do not inherit the watcher and writer threads' locks, unlike forked ones
+                _validation_executor = ProcessPoolExecutor(max_workers=workers,
+                                                           mp_context=multiprocessing.get_context('spawn'))
+        return _validation_executor
+
+
+def _discard_validation_pool(pool: Executor) -> None:
+    """
+    Drops a broken validation pool so the next large chunk starts a new one.
+    """
+    global _validation_executor
+    with _validation_pool_lock:
+        if _validation_executor is pool:
+            _validation_executor = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
 
 class BaseFileFetchHandler(ABC):
@@ -18,49 +224,105 @@ class BaseFileFetchHandler(ABC):
     :type processed_registry: ProcessedFilesRegistry
     """
 
-    def __init__(self, data_model) -> None:
+    def __init__(self, data_model, chunk_rows: Optional[int] = None,
+                 bulk_hasher: Optional[BulkHasher] = None,
+                 checksum_cache: Optional[ChecksumCache] = None,
+                 data_model_mode: Optional[str] = None,
+                 fingerprints: Optional[FingerprintIndex] = None) -> None:
         """
         Initialize the BaseFileFetchHandler with the processed registry and logger.
 
         :param processed_registry: An instance of the processed files registry.
         :type processed_registry: ProcessedFilesRegistry
+        :param chunk_rows: If set, read files in chunks of this many rows instead of all at once.
+        :type chunk_rows: Optional[int]
+        :param bulk_hasher: Optional hasher, shared between handlers, that checksums bursts of files together.
+        :type bulk_hasher: Optional[BulkHasher]
+        :param checksum_cache: Optional cache, shared between handlers, of checksums of unchanged files.
+        :type checksum_cache: Optional[ChecksumCache]
+        :param data_model_mode: How rows become records. "strict" validates every row against the
+            pydantic model. "construct" trusts the file and only keeps the model's columns, like
+            `model_construct`, which suits sources already validated upstream. "dataclass" builds the
+            `data_model` dataclass from each row, so only its `__post_init__` checks run. Defaults to
+            "dataclass" for dataclasses and "strict" otherwise.
+        :type data_model_mode: Optional[str]
+        :param fingerprints: Optional index, shared between handlers, of the checksums already processed.
+            A file whose content matches one of them is recorded as a duplicate and not processed again.
+        :type fingerprints: Optional[FingerprintIndex]
         """
+        if data_model_mode is None:
+            data_model_mode = 'dataclass' if dataclasses.is_dataclass(data_model) else 'strict'
+        if data_model_mode not in DATA_MODEL_MODES:
+            raise ValueError(f"Unknown data_model_mode {data_model_mode!r}; expected one of {DATA_MODEL_MODES}")
         self.data_model = data_model
+        self.data_model_mode = data_model_mode
+        self.chunk_rows = chunk_rows
+        self.bulk_hasher = bulk_hasher
+        self.checksum_cache = checksum_cache
+        self.fingerprints = fingerprints
+        # Column-wise validator for the model, or None to validate row by row with pydantic
+        self.frame_schema = FrameSchema.for_model(data_model) if data_model_mode == 'strict' else None
         self.logger = setup_logger()  # Initialize the logger here
+        # (path, bytes) of the small file process_file is handling, served to the parsers by `source`
+        self._loaded = None
 
     def is_file_ready(self, file_path: str) -> bool:
         """
-        Check if the file is stable and ready for processing by comparing its size after a delay.
+        Check if the file is stable and ready for processing.
+
+        Files that have not been written to for a second are ready immediately; files still
+        being written are re-checked until they settle, see `wait_until_stable`.
 
         :param file_path: The path to the file.
         :type file_path: str
-        :return: True if the file size has stabilized, False otherwise.
+        :return: True if the file has stopped changing, False otherwise.
         :rtype: bool
         """
         try:
-            initial_size = os.path.getsize(file_path)
-            time.sleep(1)
-            new_size = os.path.getsize(file_path)
-            return initial_size == new_size
+            return wait_until_stable(file_path, settle=1.0)
         except Exception as e:
             self.logger.error(f"Error checking file readiness: {e}")
             return False
 
-    def calculate_checksum(self, file_path: str) -> Optional[str]:
+    def source(self, file_path: str):
         """
-        Calculate the MD5 checksum of the file.
+        Return what the parsers should read `file_path` from.
+
+        While `process_file` handles a file it has already read into memory, this is a new in-memory
+        stream over those bytes, so the file is not read from storage a second time. Otherwise it is
+        the path itself.
 
         :param file_path: The path to the file.
         :type file_path: str
-        :return: The MD5 checksum string if successful, or None if the checksum calculation fails.
+        :return: A binary file object or the path, accepted by pandas, pyarrow and openpyxl alike.
+        """
+        if self._loaded is not None and self._loaded[0] == file_path:
+            return io.BytesIO(self._loaded[1])
+        return file_path
+
+    def calculate_checksum(self, file_path: str, data: Optional[bytes] = None,
+                           stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Calculate the SHA-256 checksum of the file with `sha256_file`, unless `checksum_cache`, or else
+        the `bulk_hasher`'s cache, holds the checksum of the unchanged file.
+
+        :param file_path: The path to the file.
+        :type file_path: str
+        :param data: The file's content, if it was already read; it is hashed instead of reading the file.
+        :type data: Optional[bytes]
+        :param stat: The file's stat, taken before `data` was read, under which the checksum is cached.
+        :type stat: Optional[os.stat_result]
+        :return: The SHA-256 checksum string if successful, or None if the checksum calculation fails.
         :rtype: Optional[str]
         """
-        hash_md5 = hashlib.md5()
+        compute = sha256_file if data is None else lambda _: hashlib.sha256(data).hexdigest()
+        checksum_cache = self.checksum_cache
+        if checksum_cache is None and self.bulk_hasher is not None:
+            checksum_cache = self.bulk_hasher.checksum_cache
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            if checksum_cache is not None:
+                return checksum_cache.get_or_compute(file_path, compute, stat)
+            return compute(file_path)
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {e}")
             return None
@@ -77,39 +339,261 @@ class BaseFileFetchHandler(ABC):
         """
         pass
 
-    def process_file(self, file_path: str) -> Optional[Tuple[List[dict], str, str]]:
+    def iter_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Yield the file's content as one or more DataFrames.
+
+        The default reads the whole file with `read_file`; subclasses override this to stream
+        large files in chunks of `chunk_rows` rows.
+
+        :param file_path: The path to the file.
+        :type file_path: str
+        :return: An iterator of DataFrames covering the file's rows in order.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        yield self.read_file(file_path)
+
+    def validate_records(self, df: pd.DataFrame) -> List[dict]:
+        """
+        Validate the rows of a DataFrame against the data model and return the valid ones as dicts.
+
+        In "strict" mode, models with only `str`, `int` and `float` fields are checked column-wise
+        by `FrameSchema`, so the DataFrame is converted to dicts only after validation; other models
+        are validated row by row, by the function `compile_row_validator` generates for them or else
+        by pydantic, spread over all cores for chunks of `PARALLEL_VALIDATION_MIN_ROWS` rows or more.
+        Invalid rows are skipped and reported in one error per chunk.
+
+        :param df: The DataFrame to validate.
+        :type df: pd.DataFrame
+        :return: The validated records.
+        :rtype: List[dict]
+        """
+        if self.validates_columnar:
+            return self.validate_frame(df).to_dict(orient='records')
+
+        if self.data_model_mode == 'dataclass':
+            field_names = self._field_names()
+            # Reads every field in one C call, which also works for slotted dataclasses
+            get_fields = operator.attrgetter(*field_names)
+            validated_records = []
+            errors = []
+            for record in df.reindex(columns=field_names).to_dict(orient='records'):
+                try:
+                    instance = self.data_model(**record)
+                except (TypeError, ValueError) as e:
+                    errors.append((record, str(e)))
+                    continue
+                values = get_fields(instance)
+                validated_records.append(dict(zip(field_names, values if len(field_names) > 1 else (values,))))
+            self._log_invalid(len(errors), len(df), errors[:INVALID_ROWS_SAMPLE])
+            return validated_records
+
+        records = df.to_dict(orient='records')
+        workers = os.cpu_count() or 1
+        # Pickling the records to and from worker processes costs more than the generated validator
+        if (len(records) < PARALLEL_VALIDATION_MIN_ROWS or workers == 1
+                or compile_row_validator(self.data_model) is not None):
+            results = [_validate_rows(self.data_model, records)]
+        else:
+            batch_size = -(-len(records) // workers)
+            batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+            pool = _validation_pool()
+            try:
+                results = list(pool.map(_validate_rows, itertools.repeat(self.data_model), batches))
+            except BrokenProcessPool as e:
+                self.logger.warning(f"Validation pool broke ({e}); validating the chunk in-process and "
+                                    f"starting a new pool for the next one.")
+                _discard_validation_pool(pool)
+                results = [_validate_rows(self.data_model, records)]
+        validated_records = []
+        invalid_count = 0
+        sample = []
+        reused = 0
+        for batch_records, errors, batch_reused in results:
+            validated_records.extend(batch_records)
+            invalid_count += len(errors)
+            sample.extend(errors[:INVALID_ROWS_SAMPLE - len(sample)])
+            reused += batch_reused
+        self._log_invalid(invalid_count, len(records), sample)
+        self.logger.debug(f"{reused} of {len(records)} rows repeated an earlier row and reused its validation.")
+        return validated_records
+
+    def validate_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate the rows of a DataFrame against the data model and return the valid ones as a DataFrame.
+
+        With a `FrameSchema`, or in "construct" mode, the rows never become Python dicts; other models
+        go through `validate_records` and the records are collected back into a DataFrame.
+
+        :param df: The DataFrame to validate.
+        :type df: pd.DataFrame
+        :return: The valid rows, with the model's fields as columns.
+        :rtype: pd.DataFrame
+        """
+        if self.data_model_mode == 'construct':
+            return df.reindex(columns=self._field_names())
+
+        if self.frame_schema is None:
+            return pd.DataFrame(self.validate_records(df), columns=self._field_names())
+
+        valid, failures = self.frame_schema.validate(df)
+        if len(failures):
+            sample = [(df.loc[index].to_dict(), f"invalid field(s) {', '.join(failed.index[failed])}")
+                      for index, failed in failures.head(INVALID_ROWS_SAMPLE).iterrows()]
+            self._log_invalid(len(failures), len(df), sample)
+        return valid
+
+    def _log_invalid(self, invalid_count: int, row_count: int, sample: List[Tuple[dict, str]]) -> None:
+        # One line per chunk rather than per invalid row, with the first few rows as examples
+        if invalid_count:
+            examples = "; ".join(f"{record}: {error}" for record, error in sample)
+            self.logger.error(f"Validation failed for {invalid_count} of {row_count} rows, e.g. {examples}")
+
+    @property
+    def validates_columnar(self) -> bool:
+        """
+        True if rows are validated column-wise, so `process_file_columnar` never builds a dict per row.
+        """
+        return self.frame_schema is not None or self.data_model_mode == 'construct'
+
+    def _field_names(self) -> List[str]:
+        if dataclasses.is_dataclass(self.data_model):
+            return [field.name for field in dataclasses.fields(self.data_model)]
+        return list(self.data_model.model_fields)
+
+    def process_file(self, file_path: str,
+                     on_chunk: Optional[Callable[[List[dict]], None]] = None,
+                     check_ready: bool = True) -> Optional[Tuple[List[dict], str, str]]:
         """
         Process the file if it's ready, calculate checksum, validate data records, and return metadata.
 
+        The checksum is computed while the first chunk is parsed, and each following chunk is read
+        while the previous one is validated.
+
         :param file_path: The path to the file.
         :type file_path: str
+        :param on_chunk: If given, called with each chunk's validated records as soon as the chunk is
+            validated, so they can be saved while the rest of the file is parsed. The records are then
+            not accumulated in the returned list.
+        :type on_chunk: Optional[Callable[[List[dict]], None]]
+        :param check_ready: Set to False when the caller already knows the file is complete, e.g. after
+            the file watcher reported it closed, to skip `is_file_ready`.
+        :type check_ready: bool
         :return: A tuple containing validated records, filename, and checksum if successful, or None if an error occurs.
         :rtype: Optional[Tuple[List[dict], str, str]]
         """
+        result = self._process(file_path, self.validate_records, on_chunk, check_ready)
+        if result is not None:
+            chunks, filename, checksum = result
+            return [record for chunk in chunks for record in chunk], filename, checksum
+
+    def process_file_columnar(self, file_path: str,
+                              on_chunk: Optional[Callable[[pd.DataFrame], None]] = None,
+                              check_ready: bool = True) -> Optional[Tuple[pd.DataFrame, str, str]]:
+        """
+        Like `process_file`, but keeps the validated rows in DataFrames instead of lists of dicts.
+
+        The database handlers save DataFrames, so handing them the validated chunks directly avoids
+        allocating a dict per row only to build a DataFrame from the dicts again.
+
+        :param file_path: The path to the file.
+        :type file_path: str
+        :param on_chunk: If given, called with each chunk's validated DataFrame as soon as the chunk is
+            validated. The chunks are then not included in the returned DataFrame.
+        :type on_chunk: Optional[Callable[[pd.DataFrame], None]]
+        :param check_ready: Set to False when the caller already knows the file is complete.
+        :type check_ready: bool
+        :return: A tuple containing the validated rows, filename, and checksum if successful, or None if an error occurs.
+        :rtype: Optional[Tuple[pd.DataFrame, str, str]]
+        """
+        result = self._process(file_path, self.validate_frame, on_chunk, check_ready)
+        if result is not None:
+            chunks, filename, checksum = result
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=self._field_names())
+            return df, filename, checksum
+
+    def _process(self, file_path: str, validate: Callable, on_chunk: Optional[Callable],
+                 check_ready: bool) -> Optional[Tuple[list, str, str]]:
         filename = os.path.basename(file_path)
 
-        if not self.is_file_ready(file_path):
+        if check_ready and not self.is_file_ready(file_path):
             self.logger.info(f"File {filename} is not ready. Will retry later.")
             return
 
-        checksum = self.calculate_checksum(file_path)
-        if not checksum:
-            self.logger.error(f"Failed to calculate checksum for {filename}.")
-            return
+        # Small files are read once; the checksum and the parser both use those bytes
+        data, stat = self._read_small_file(file_path)
+        self._loaded = (file_path, data) if data is not None else None
+
+        # Hash the file while its first chunk is parsed
+        if data is not None:
+            pending_checksum = _IO_POOL.submit(self.calculate_checksum, file_path, data, stat)
+        elif self.bulk_hasher is not None:
+            pending_checksum = self.bulk_hasher.submit(file_path)
+        else:
+            pending_checksum = _IO_POOL.submit(self.calculate_checksum, file_path)
 
+        checksum = None
+        claimed = False
+        handed_off = False
+        succeeded = False
         try:
-            df = self.read_file(file_path)
-            records = df.to_dict(orient='records')
-            validated_records = []
-            for record in records:
-                try:
-                    validated_record = self.data_model(**record).dict()
-                    validated_records.append(validated_record)
-                except ValidationError as e:
-                    self.logger.error(f"Validation error for record {record}: {e}")
-            if validated_records:
-                return validated_records, filename, checksum
+            if self.fingerprints is not None:
+                # Duplicates are skipped before any of their rows are parsed; a copy of a file still
+                # being processed waits here until that file is done
+                checksum = pending_checksum.result()
+                if not checksum:
+                    self.logger.error(f"Failed to calculate checksum for {filename}.")
+                    return
+                original = self.fingerprints.claim(checksum, filename)
+                if original is not None:
+                    self.logger.info(f"Skipping {filename}: same content as {original}.")
+                    return [], filename, checksum
+                claimed = True
+
+            validated_chunks = []
+            valid_count = 0
+            with contextlib.closing(read_ahead(self.iter_chunks(file_path))) as chunks:
+                for df in chunks:
+                    if checksum is None:
+                        checksum = pending_checksum.result()
+                        if not checksum:
+                            self.logger.error(f"Failed to calculate checksum for {filename}.")
+                            return
+                    validated = validate(df)
+                    valid_count += len(validated)
+                    if on_chunk is None:
+                        validated_chunks.append(validated)
+                    elif len(validated):
+                        on_chunk(validated)
+                        handed_off = True
+            if valid_count:
+                succeeded = True
+                return validated_chunks, filename, checksum
             else:
                 self.logger.info(f"No valid records found in {filename}.")
         except Exception as e:
             self.logger.error(f"Failed to process file {file_path}: {e}")
+        finally:
+            if claimed and (succeeded or handed_off):
+                if not succeeded:
+                    # Processing a copy would save the rows already handed off a second time
+                    self.logger.warning(f"Keeping the content of {filename} claimed: some of its rows were "
+                                        f"already saved, so copies of it will be skipped.")
+                self.fingerprints.finish(checksum, filename)
+            elif claimed:
+                # Let a copy of the file, waiting or later, be processed instead
+                self.fingerprints.release(checksum, filename)
+            self._loaded = None
+
+    def _read_small_file(self, file_path: str) -> Tuple[Optional[bytes], Optional[os.stat_result]]:
+        max_bytes = FUSED_READ_CHUNKED_MAX_BYTES if self.chunk_rows else FUSED_READ_MAX_BYTES
+        try:
+            with open(file_path, 'rb') as f:
+                # Stat'ed before reading, so a write during the read invalidates the cached checksum
+                stat = os.fstat(f.fileno())
+                if stat.st_size > max_bytes:
+                    return None, None
+                return f.read(), stat
+        except OSError:
+            # Left to the regular path, which reports the error
+            return None, None
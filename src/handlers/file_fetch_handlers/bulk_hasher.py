@@ -0,0 +1,141 @@
+# src/handlers/file_fetch_handlers/bulk_hasher.py
+
+import hashlib
+import mmap
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.utils.logger import setup_logger
+
+# Buffer size hashlib.file_digest reads the file with
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+
+def sha256_file(file_path: str) -> str:
+    """
+    Calculate the SHA-256 checksum of a file.
+
+    The kernel is told the file will be read sequentially, so it reads ahead aggressively.
+    On Python 3.11+ ``hashlib.file_digest`` hashes the file in OpenSSL in 1 MiB reads without a
+    Python-level loop, using the CPU's SHA extensions where available. Older interpreters map
+    the file and hash the whole mapping in a single ``update`` call.
+
+    :param file_path: The path to the file.
+    :type file_path: str
+    :return: The hex SHA-256 digest of the file's bytes.
+    :rtype: str
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256', _bufsize=CHECKSUM_BLOCK_SIZE).hexdigest()
+        hash_sha256 = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hash_sha256.update(mapped)
+        return hash_sha256.hexdigest()
+
+
+class BulkHasher:
+    """
+    Hashes bursts of files together on a pool of threads.
+
+    Submitted files are collected until `batch_size` are pending or `max_wait` seconds have
+    passed since the first one arrived, then the batch is hashed concurrently. hashlib releases
+    the GIL while digesting, so a burst of new files is hashed in parallel instead of one after
+    another. Each batch is started largest file first so its hashes finish close together.
+
+    :param batch_size: Maximum number of files hashed together.
+    :type batch_size: int
+    :param max_wait: Seconds to wait for a batch to fill before hashing what is pending.
+    :type max_wait: float
+    :param checksum_cache: Optional cache consulted before hashing, so unchanged files are not read again.
+    :type checksum_cache: Optional[ChecksumCache]
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_size: int = 8, max_wait: float = 0.05,
+                 checksum_cache: Optional[ChecksumCache] = None) -> None:
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.checksum_cache = checksum_cache
+        self.logger = setup_logger()
+        self._q = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=batch_size, thread_name_prefix="bulk-hasher")
+        self._thread = threading.Thread(target=self._run, name="bulk-hasher", daemon=True)
+        self._thread.start()
+
+    def submit(self, file_path: str) -> 'Future[Optional[str]]':
+        """
+        Queues a file for hashing.
+
+        :param file_path: The path to the file.
+        :type file_path: str
+        :return: A future resolving to the SHA-256 checksum, or None if the file could not be hashed.
+        :rtype: Future[Optional[str]]
+        """
+        future = Future()
+        self._q.put((file_path, future))
+        return future
+
+    def close(self) -> None:
+        """
+        Hashes the files still queued and stops the worker threads.
+        """
+        self._q.put(self._STOP)
+        self._thread.join()
+        self._executor.shutdown()
+
+    def _run(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._hash_batch(batch)
+            if stopping:
+                return
+
+    def _hash_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        batch = [(path, future) for path, future in batch if future.set_running_or_notify_cancel()]
+        batch.sort(key=lambda item: self._file_size(item[0]), reverse=True)
+        for (path, future), checksum in zip(batch, self._executor.map(self._hash, [path for path, _ in batch])):
+            future.set_result(checksum)
+
+    def _hash(self, file_path: str) -> Optional[str]:
+        try:
+            if self.checksum_cache is not None:
+                return self.checksum_cache.get_or_compute(file_path, sha256_file)
+            return sha256_file(file_path)
+        except Exception as e:
+            self.logger.error(f"Error calculating checksum for {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def _file_size(file_path: str) -> int:
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return 0
@@ -0,0 +1,61 @@
+# src/handlers/file_fetch_handlers/checksum_cache.py
+
+import collections
+import os
+import threading
+from typing import Callable, Optional
+
+
+class ChecksumCache:
+    """
+    Thread-safe cache of file checksums keyed by the file's identity and version.
+
+    Entries are keyed by ``(st_dev, st_ino)`` and remember the ``st_size`` and ``st_mtime_ns``
+    the file had when it was hashed, so a file that was not modified since is never read again,
+    while any write invalidates its entry. The least recently used entries are evicted once
+    `maxsize` files are cached.
+
+    :param maxsize: Maximum number of files to remember.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, file_path: str, compute: Callable[[str], str],
+                       stat: Optional[os.stat_result] = None) -> str:
+        """
+        Returns the cached checksum of an unchanged file, or computes and caches it.
+
+        The file is stat'ed before hashing, so if it changes while it is hashed the entry no
+        longer matches on the next lookup. A caller that already read the file passes the stat
+        it took before reading, for the same reason.
+
+        :param file_path: The path to the file.
+        :type file_path: str
+        :param compute: Function computing the checksum of a file path.
+        :type compute: Callable[[str], str]
+        :param stat: The file's stat, taken before its content was read; stat'ed here if omitted.
+        :type stat: Optional[os.stat_result]
+        :return: The file's checksum.
+        :rtype: str
+        :raises OSError: If the file cannot be stat'ed or read.
+        """
+        st = stat if stat is not None else os.stat(file_path)
+        key = (st.st_dev, st.st_ino)
+        version = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        checksum = compute(file_path)
+        with self._lock:
+            self._entries[key] = (version, checksum)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return checksum
@@ -1,7 +1,54 @@
 # src/handlers/file_handlers/csv_fetch_handler.py
 
+import dataclasses
+import os
+import typing
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from typing import Dict, Iterator, List, Optional
 from src.handlers.file_fetch_handlers.base_file_fetcher_handler import BaseFileFetchHandler
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.handlers.file_fetch_handlers.fingerprint_index import FingerprintIndex
+from src.models.data_record import DataRecordCSV
+
+# Bytes pyarrow tokenises per block; each block is parsed on its own thread
+PYARROW_BLOCK_SIZE = 8 << 20
+
+
+def _to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Converts a parsed table to pandas, keeping string columns in Arrow memory.
+
+    Without a types mapper every string becomes a Python object, which the database handlers
+    then convert back to Arrow (MongoDB) or walk cell by cell; an `ArrowDtype` column is
+    handed over without either copy.
+    """
+    return table.to_pandas(types_mapper=_arrow_strings)
+
+
+def _arrow_strings(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def _string_fields(data_model) -> List[str]:
+    """
+    Returns the names of a model's `str` and `Optional[str]` fields.
+    """
+    if dataclasses.is_dataclass(data_model):
+        hints = typing.get_type_hints(data_model)
+    else:
+        hints = {name: field.annotation for name, field in data_model.model_fields.items()}
+    return [name for name, hint in hints.items() if hint is str or str in typing.get_args(hint)]
+
+
+def _arrow_type(dtype) -> pa.DataType:
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+    return pa.string() if pd.api.types.is_string_dtype(dtype) else pa.from_numpy_dtype(dtype)
 
 
 class CSVFetchHandler(BaseFileFetchHandler):
@@ -11,7 +58,47 @@ class CSVFetchHandler(BaseFileFetchHandler):
     :param processed_registry: The registry used to track processed files.
     :type processed_registry: ProcessedFilesRegistry
     """
-    
+
+    def __init__(self, data_model=DataRecordCSV, chunk_rows: Optional[int] = None,
+                 schema_cache: Optional[Dict[bytes, dict]] = None,
+                 bulk_hasher: Optional[BulkHasher] = None, checksum_cache: Optional[ChecksumCache] = None,
+                 data_model_mode: Optional[str] = None,
+                 fingerprints: Optional[FingerprintIndex] = None,
+                 engine: Optional[str] = None) -> None:
+        """
+        Initialize the CSVFetchHandler.
+
+        :param data_model: The pydantic model used to validate each row.
+        :param chunk_rows: If set, parse files in chunks of this many rows.
+        :type chunk_rows: Optional[int]
+        :param schema_cache: Optional dictionary, shared between handlers, mapping a CSV header line to
+            the column dtypes inferred for it. Files with a known header are parsed with those dtypes,
+            skipping pandas' per-file type inference.
+        :type schema_cache: Optional[Dict[bytes, dict]]
+        :param bulk_hasher: Optional hasher, shared between handlers, that checksums bursts of files together.
+        :type bulk_hasher: Optional[BulkHasher]
+        :param checksum_cache: Optional cache, shared between handlers, of checksums of unchanged files.
+        :type checksum_cache: Optional[ChecksumCache]
+        :param data_model_mode: "strict", "construct" or "dataclass"; see `BaseFileFetchHandler`.
+        :type data_model_mode: Optional[str]
+        :param fingerprints: Optional index, shared between handlers, of the checksums already processed.
+        :type fingerprints: Optional[FingerprintIndex]
+        :param engine: CSV parser to use, "pandas" or "pyarrow". Defaults to the FDF_FAST_IO environment
+            variable, or "pandas" if it is not set. pyarrow's reader tokenises blocks of the file on
+            several threads.
+        :type engine: Optional[str]
+        """
+        super().__init__(data_model, chunk_rows=chunk_rows, bulk_hasher=bulk_hasher,
+                         checksum_cache=checksum_cache, data_model_mode=data_model_mode,
+                         fingerprints=fingerprints)
+        self.schema_cache = schema_cache
+        # pyarrow would infer dates, timestamps and booleans in text the model expects as str
+        self._string_types = {name: pa.string() for name in _string_fields(data_model)}
+        self.engine = (engine or os.getenv("FDF_FAST_IO", "pandas")).lower()
+        if self.engine not in ("pandas", "pyarrow"):
+            self.logger.warning(f"Unsupported CSV engine {self.engine}; falling back to pandas.")
+            self.engine = "pandas"
+
     def read_file(self, file_path: str) -> pd.DataFrame:
         """
         Read a CSV file and return a pandas DataFrame.
@@ -21,4 +108,120 @@ class CSVFetchHandler(BaseFileFetchHandler):
         :return: A pandas DataFrame containing the content of the CSV file.
         :rtype: pd.DataFrame
         """
-        return pd.read_csv(file_path)
+        if self.engine == "pyarrow":
+            return _to_pandas(self._read_arrow(file_path))
+        return pd.read_csv(self.source(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Yield the CSV file in chunks of `chunk_rows` rows using pandas' chunked C parser.
+
+        Only one chunk is held in memory at a time. Without `chunk_rows` the file is read in one go.
+        With a `schema_cache`, the dtypes inferred for a header are reused for later files with the
+        same header; if a file no longer fits them, the entry is dropped and the remaining rows are
+        parsed with inference.
+
+        :param file_path: The path to the CSV file.
+        :type file_path: str
+        :return: An iterator of DataFrames covering the file's rows in order.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        if self.schema_cache is None:
+            yield from self._read_chunks(file_path)
+            return
+
+        header_key = self._read_header(file_path)
+        dtype = self.schema_cache.get(header_key)
+        inferred = None
+        rows_read = 0
+        try:
+            for chunk in self._read_chunks(file_path, dtype=dtype):
+                if dtype is None:
+                    # Only cache a schema every chunk agrees on
+                    chunk_dtypes = chunk.dtypes.to_dict()
+                    inferred = chunk_dtypes if rows_read == 0 or inferred == chunk_dtypes else {}
+                rows_read += len(chunk)
+                yield chunk
+        except (ValueError, TypeError, OverflowError):
+            if dtype is None:
+                raise
+            self.logger.info(f"Cached schema does not match {file_path}; re-inferring column types.")
+            self.schema_cache.pop(header_key, None)
+            yield from self._read_chunks(file_path, skip_rows=rows_read)
+            return
+
+        if inferred:
+            self.schema_cache[header_key] = inferred
+
+    def _read_chunks(self, file_path: str, dtype: Optional[dict] = None,
+                     skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+        if self.engine == "pyarrow":
+            yield from self._read_chunks_arrow(file_path, dtype, skip_rows)
+        else:
+            yield from self._read_chunks_pandas(file_path, dtype, skip_rows)
+
+    def _read_chunks_pandas(self, file_path: str, dtype: Optional[dict],
+                            skip_rows: int) -> Iterator[pd.DataFrame]:
+        read_options = {"dtype": dtype}
+        if skip_rows:
+            read_options["skiprows"] = range(1, skip_rows + 1)
+        if not self.chunk_rows:
+            yield pd.read_csv(self.source(file_path), **read_options)
+            return
+
+        with pd.read_csv(self.source(file_path), chunksize=self.chunk_rows, low_memory=False, **read_options) as reader:
+            yield from reader
+
+    def _read_chunks_arrow(self, file_path: str, dtype: Optional[dict],
+                           skip_rows: int) -> Iterator[pd.DataFrame]:
+        rows_yielded = 0
+        try:
+            if not self.chunk_rows:
+                yield _to_pandas(self._read_arrow(file_path, dtype, skip_rows))
+                return
+
+            pending = []
+            pending_rows = 0
+            with pacsv.open_csv(self.source(file_path), **self._arrow_options(dtype, skip_rows)) as reader:
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows < self.chunk_rows:
+                        continue
+                    table = pa.Table.from_batches(pending)
+                    offset = 0
+                    while pending_rows - offset >= self.chunk_rows:
+                        yield _to_pandas(table.slice(offset, self.chunk_rows))
+                        offset += self.chunk_rows
+                        rows_yielded += self.chunk_rows
+                    pending = table.slice(offset).to_batches()
+                    pending_rows -= offset
+            if pending_rows:
+                yield _to_pandas(pa.Table.from_batches(pending))
+        except pa.ArrowInvalid:
+            if dtype is not None:
+                raise
+            # Streaming infers column types from the first block; re-read the rest with pandas
+            # if a later block does not fit them
+            self.logger.info(f"pyarrow could not parse {file_path}; reading the remaining rows with pandas.")
+            yield from self._read_chunks_pandas(file_path, None, skip_rows + rows_yielded)
+
+    def _read_arrow(self, file_path: str, dtype: Optional[dict] = None, skip_rows: int = 0) -> pa.Table:
+        return pacsv.read_csv(self.source(file_path), **self._arrow_options(dtype, skip_rows))
+
+    def _arrow_options(self, dtype: Optional[dict], skip_rows: int) -> dict:
+        column_types = {name: _arrow_type(value) for name, value in (dtype or {}).items()}
+        column_types.update(self._string_types)
+        return {
+            "read_options": pacsv.ReadOptions(use_threads=True, block_size=PYARROW_BLOCK_SIZE,
+                                              skip_rows_after_names=skip_rows),
+            # Empty fields become nulls, as they become NaN with pandas
+            "convert_options": pacsv.ConvertOptions(column_types=column_types or None, strings_can_be_null=True),
+        }
+
+    def _read_header(self, file_path: str) -> bytes:
+        source = self.source(file_path)
+        if not isinstance(source, str):
+            return source.readline().rstrip(b"\r\n")
+        with open(source, 'rb') as f:
+            return f.readline().rstrip(b"\r\n")
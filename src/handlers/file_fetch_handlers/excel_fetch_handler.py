@@ -1,7 +1,23 @@
 # src/handlers/file_handlers/excel_fetch_handler.py
 
+import contextlib
+import importlib.util
+import itertools
+import openpyxl
 import pandas as pd
+from typing import Iterator, Optional, Tuple
 from src.handlers.file_fetch_handlers.base_file_fetcher_handler import BaseFileFetchHandler
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.handlers.file_fetch_handlers.fingerprint_index import FingerprintIndex
+from src.models.data_record import DataRecordExcel
+
+# Workbook formats openpyxl can read in read-only mode
+STREAMABLE_EXTENSIONS = (".xlsx", ".xlsm")
+
+# python-calamine parses workbooks in Rust; when installed it reads every format instead of openpyxl/xlrd
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
 
 class ExcelFetchHandler(BaseFileFetchHandler):
     """
@@ -11,13 +27,107 @@ class ExcelFetchHandler(BaseFileFetchHandler):
     :type processed_registry: ProcessedFilesRegistry
     """
 
+    def __init__(self, data_model=DataRecordExcel, chunk_rows: Optional[int] = None,
+                 bulk_hasher: Optional[BulkHasher] = None,
+                 checksum_cache: Optional[ChecksumCache] = None,
+                 data_model_mode: Optional[str] = None,
+                 fingerprints: Optional[FingerprintIndex] = None) -> None:
+        """
+        Initialize the ExcelFetchHandler.
+
+        :param data_model: The pydantic model used to validate each row.
+        :param chunk_rows: If set, stream `.xlsx` workbooks in chunks of this many rows.
+        :type chunk_rows: Optional[int]
+        :param bulk_hasher: Optional hasher, shared between handlers, that checksums bursts of files together.
+        :type bulk_hasher: Optional[BulkHasher]
+        :param checksum_cache: Optional cache, shared between handlers, of checksums of unchanged files.
+        :type checksum_cache: Optional[ChecksumCache]
+        :param data_model_mode: "strict", "construct" or "dataclass"; see `BaseFileFetchHandler`.
+        :type data_model_mode: Optional[str]
+        :param fingerprints: Optional index, shared between handlers, of the checksums already processed.
+        :type fingerprints: Optional[FingerprintIndex]
+        """
+        super().__init__(data_model, chunk_rows=chunk_rows, bulk_hasher=bulk_hasher,
+                         checksum_cache=checksum_cache, data_model_mode=data_model_mode,
+                         fingerprints=fingerprints)
+
     def read_file(self, file_path: str) -> pd.DataFrame:
         """
         Read an Excel file and return a pandas DataFrame.
 
+        With python-calamine installed, every workbook is read by `pd.read_excel` with its
+        `calamine` engine. Otherwise `.xlsx` workbooks are read with `iter_rows` in openpyxl's
+        read-only mode, and legacy `.xls` files go through `pd.read_excel`.
+
         :param file_path: The path to the Excel file.
         :type file_path: str
         :return: A pandas DataFrame containing the content of the Excel file.
         :rtype: pd.DataFrame
         """
-        return pd.read_excel(file_path)
+        if CALAMINE_AVAILABLE:
+            return pd.read_excel(self.source(file_path), engine="calamine")
+        if not file_path.endswith(STREAMABLE_EXTENSIONS):
+            return pd.read_excel(self.source(file_path))
+
+        with self._open_rows(file_path) as (header, rows):
+            if header is None:
+                return pd.DataFrame()
+            return pd.DataFrame.from_records(list(rows), columns=header)
+
+    def iter_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Yield the first worksheet in chunks of `chunk_rows` rows.
+
+        `.xlsx` workbooks are opened in openpyxl's read-only mode, which parses the sheet XML
+        as a stream instead of building the whole workbook in memory. Legacy `.xls` files, which
+        openpyxl cannot read, are handed out row by row from calamine's iterator when
+        python-calamine is installed, so no DataFrame of the whole sheet is built. Otherwise, or
+        for handlers without `chunk_rows`, the workbook is read in one go with `read_file`.
+
+        :param file_path: The path to the Excel file.
+        :type file_path: str
+        :return: An iterator of DataFrames covering the sheet's rows in order.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        if self.chunk_rows and file_path.endswith(STREAMABLE_EXTENSIONS):
+            open_rows = self._open_rows
+        elif self.chunk_rows and CALAMINE_AVAILABLE:
+            open_rows = self._open_calamine_rows
+        else:
+            yield from super().iter_chunks(file_path)
+            return
+
+        with open_rows(file_path) as (header, rows):
+            if header is None:
+                return
+            while True:
+                batch = list(itertools.islice(rows, self.chunk_rows))
+                if not batch:
+                    break
+                yield pd.DataFrame.from_records(batch, columns=header)
+
+    @contextlib.contextmanager
+    def _open_rows(self, file_path: str) -> Iterator[Tuple[Optional[tuple], Iterator[tuple]]]:
+        workbook = openpyxl.load_workbook(self.source(file_path), read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            # Skip fully empty rows, which read-only mode yields for formatted but blank cells
+            yield header, (row for row in rows if any(value is not None for value in row))
+        finally:
+            workbook.close()
+
+    @contextlib.contextmanager
+    def _open_calamine_rows(self, file_path: str) -> Iterator[Tuple[Optional[list], Iterator[tuple]]]:
+        import python_calamine
+
+        with contextlib.ExitStack() as stack:
+            source = self.source(file_path)
+            if isinstance(source, str):
+                # Read from a file object so calamine detects the format from the content, not the name
+                source = stack.enter_context(open(source, 'rb'))
+            rows = python_calamine.CalamineWorkbook.from_filelike(source).get_sheet_by_index(0).iter_rows()
+            header = next(rows, None)
+            # calamine reports empty cells as "", which openpyxl and pandas report as missing
+            yield header, (tuple(None if value == "" else value for value in row)
+                           for row in rows if any(value != "" for value in row))
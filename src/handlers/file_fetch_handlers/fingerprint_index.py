@@ -0,0 +1,93 @@
+# src/handlers/file_fetch_handlers/fingerprint_index.py
+
+import threading
+from typing import Dict, List, Optional, Set
+
+
+class FingerprintIndex:
+    """
+    Thread-safe index of the checksums of files whose records were already processed.
+
+    Files with identical content, such as mirrored feeds or re-uploads under a new name, share
+    one checksum. The first file to claim a checksum is processed; later copies are only recorded
+    as aliases of it, so their rows are not parsed, validated or inserted again. A copy arriving
+    while the first file is still being processed waits for it, so it is processed instead if the
+    first file fails.
+    """
+
+    def __init__(self) -> None:
+        self._owners: Dict[str, str] = {}
+        # Checksums whose owner is still being processed
+        self._pending: Set[str] = set()
+        self._aliases: Dict[str, List[str]] = {}
+        self._changed = threading.Condition()
+
+    def claim(self, checksum: str, filename: str) -> Optional[str]:
+        """
+        Claims a checksum for a file, unless another file already holds it.
+
+        If the file holding the checksum is still being processed, waits until it calls `finish`
+        or `release`.
+
+        :param checksum: The checksum of the file's content.
+        :type checksum: str
+        :param filename: The name of the file.
+        :type filename: str
+        :return: None if the file should be processed, in which case it must later call `finish`
+            or `release`; otherwise the name of the file that holds the checksum, in which case
+            `filename` is recorded as its alias.
+        :rtype: Optional[str]
+        """
+        with self._changed:
+            while True:
+                owner = self._owners.get(checksum)
+                if owner is None:
+                    self._owners[checksum] = filename
+                    self._pending.add(checksum)
+                    return None
+                if owner == filename:
+                    return None
+                if checksum not in self._pending:
+                    self._aliases.setdefault(checksum, []).append(filename)
+                    return owner
+                self._changed.wait()
+
+    def finish(self, checksum: str, filename: str) -> None:
+        """
+        Marks a claimed checksum as processed, so copies waiting in `claim` are skipped.
+
+        :param checksum: The checksum of the file's content.
+        :type checksum: str
+        :param filename: The name of the file that claimed it.
+        :type filename: str
+        """
+        with self._changed:
+            if self._owners.get(checksum) == filename:
+                self._pending.discard(checksum)
+                self._changed.notify_all()
+
+    def release(self, checksum: str, filename: str) -> None:
+        """
+        Gives up a checksum claimed by a file that failed to process, so a copy can be processed.
+
+        :param checksum: The checksum of the file's content.
+        :type checksum: str
+        :param filename: The name of the file that claimed it.
+        :type filename: str
+        """
+        with self._changed:
+            if self._owners.get(checksum) == filename:
+                del self._owners[checksum]
+                self._pending.discard(checksum)
+                self._changed.notify_all()
+
+    def aliases(self, checksum: str) -> List[str]:
+        """
+        Returns the names of the duplicate files skipped for a checksum.
+
+        :param checksum: The checksum of the file's content.
+        :type checksum: str
+        :rtype: List[str]
+        """
+        with self._changed:
+            return list(self._aliases.get(checksum, ()))
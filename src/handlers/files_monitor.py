@@ -1,25 +1,30 @@
 # src/handlers/files_monitor.py
 
+import logging
 import os
-import time
+import threading
 import pandas as pd
 import asyncio
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
-from pandas import DataFrame
+from watchdog.events import FileSystemEventHandler, FileSystemEvent, FileCreatedEvent, FileClosedEvent
 from src.handlers.file_fetch_handlers.csv_fetch_handler import CSVFetchHandler
 from src.handlers.file_fetch_handlers.excel_fetch_handler import ExcelFetchHandler
+from src.utils.file_ready import wait_until_stable
 from src.utils.logger import setup_logger
 from src.handlers.db_handlers.base_db_handler import BaseDBHandler
 from typing import Dict, Callable
 
+# Rows of a new file shown in the debug log
+PREVIEW_ROWS = 10
+
 
 class FileMonitorHandler(FileSystemEventHandler):
     """
     FileMonitorHandler handles the detection of new files and initiates
-    processing for supported file types (CSV and Excel). Uses an asynchronous
-    approach to allow concurrent file handling.
+    processing for supported file types (CSV and Excel). Files are processed
+    concurrently on a pool of worker threads, so the observer thread is never
+    blocked by parsing, validation or database writes.
 
     :param db_handler: The database handler to be used for storing processed data.
     :type db_handler: BaseDBHandler
@@ -27,17 +32,27 @@ class FileMonitorHandler(FileSystemEventHandler):
     :type dry_run: bool
     :param file_handlers: A dictionary mapping file extensions to file handlers.
     :type file_handlers: Dict[str, Callable]
-    :param loop: The asyncio event loop to run coroutines.
+    :param wait_for_close: If True, new files are processed when the observer reports them closed
+        after writing instead of being polled for a stable size.
+    :type wait_for_close: bool
+    :param max_workers: Number of files processed concurrently.
+    :type max_workers: int
+    :param max_pending: Maximum number of files queued or being processed before new events wait.
+    :type max_pending: int
     """
 
     def __init__(self, db_handler: 'BaseDBHandler', dry_run: bool = False,
-                 file_handlers: Dict[str, Callable] = None, loop=None) -> None:
+                 file_handlers: Dict[str, Callable] = None, wait_for_close: bool = False,
+                 max_workers: int = None, max_pending: int = 64) -> None:
         """
         Initializes the FileMonitorHandler.
 
         :param db_handler: The database handler used for saving processed data.
         :param dry_run: If set to True, only logs operations without committing data to the database.
         :param file_handlers: A dictionary mapping file extensions to handler classes.
+        :param wait_for_close: If set to True, process new files on their close-after-write event.
+        :param max_workers: Number of worker threads processing files; defaults to the CPU count.
+        :param max_pending: Maximum number of files in flight before the observer thread waits.
         """
         self.db_handler = db_handler
         self.logger = setup_logger()
@@ -47,74 +62,113 @@ class FileMonitorHandler(FileSystemEventHandler):
             ".xls": ExcelFetchHandler,
             ".xlsx": ExcelFetchHandler,
         }
-        self.loop = loop or asyncio.get_event_loop()
+        self.wait_for_close = wait_for_close
+        # Files created since the watch started that have not been closed after writing yet
+        self._pending_close = set()
+        # Files are processed on worker threads so the observer thread only dispatches events
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count(), thread_name_prefix="fetch")
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._thread_handlers = threading.local()
+        # Supported extensions, for a single endswith check per file event
+        self._suffixes = tuple(self.file_handlers)
 
     def is_file_ready(self, file_path: str) -> bool:
         """
-        Checks if a file is ready for processing by comparing its size over a short time interval.
+        Checks if a file is ready for processing, i.e. has not been written to for two seconds.
+
+        This is the fallback for observers without close events; see `wait_until_stable`.
 
         :param file_path: Path to the file being checked.
         :type file_path: str
-        :return: True if the file size is stable, indicating the file is ready for processing.
+        :return: True if the file has stopped changing, indicating the file is ready for processing.
         :rtype: bool
         """
         try:
-            initial_size = os.path.getsize(file_path)
-            time.sleep(2)
-            new_size = os.path.getsize(file_path)
-            return initial_size == new_size
+            return wait_until_stable(file_path, settle=2.0)
         except Exception as e:
             self.logger.error(f"Error checking file readiness: {e}")
             return False
 
     async def handle_file(self, file_path: str):
         """
-        Handles file processing asynchronously, assigning the appropriate handler based on file extension.
+        Handles file processing asynchronously by running `process_path` on the worker pool.
+
+        :param file_path: The path to the newly created file.
+        """
+        await asyncio.wrap_future(self.pool.submit(self.process_path, file_path))
+
+    def process_path(self, file_path: str) -> None:
+        """
+        Processes a complete file, assigning the appropriate handler based on file extension.
 
         :param file_path: The path to the newly created file.
         """
         ext = os.path.splitext(file_path)[-1]
-        handler_class = self.file_handlers.get(ext)
 
         self.logger.info(f"Attempting to handle the file {file_path}")
 
-        if handler_class is None:
+        handler = self._handler_for(ext)
+        if handler is None:
             self.logger.warning(f"Unsupported file type: {file_path}")
             return
 
-        # Log file content if it's a CSV or Excel file
-        if ext == ".csv":
-            try:
-                self.logger.info(f"Reading content of CSV file: {file_path}")
-                df = pd.read_csv(file_path)  # Read the CSV file
-                self.logger.info(f"File content:\n{df.to_string(index=False)}")  # Print the content of the CSV file
-            except Exception as e:
-                self.logger.error(f"Error reading CSV file {file_path}: {e}")
-                return
-        elif ext in [".xls", ".xlsx"]:
-            try:
-                self.logger.info(f"Reading content of Excel file: {file_path}")
-                df = pd.read_excel(file_path)  # Read the Excel file
-                self.logger.info(f"File content:\n{df.to_string(index=False)}")  # Print the content of the Excel file
-            except Exception as e:
-                self.logger.error(f"Error reading Excel file {file_path}: {e}")
-                return
-
         # Process the file with the correct handler
-        handler = handler_class()
-        processed_data = handler.process_file(file_path)
+        # Outside dry-run mode every validated chunk goes to the background writer as soon as
+        # it is parsed, so inserting overlaps with parsing the rest of the file. The chunks stay
+        # DataFrames, which is what the database handlers save, instead of becoming dicts per row.
+        # Models validated row by row yield dicts anyway; a database handler inserting dicts gets
+        # those as they are rather than a DataFrame built from them only to be converted back.
+        # The file's content is logged from the first chunk the handler parsed, not read again.
+        as_records = getattr(self.db_handler, 'accepts_records', False) and not handler.validates_columnar
+        process = handler.process_file if as_records else handler.process_file_columnar
+        previewed = False
+
+        def forward(chunk) -> None:
+            nonlocal previewed
+            if not previewed:
+                self._log_preview(file_path, chunk)
+                previewed = True
+            self.db_handler.enqueue(chunk)
+
+        on_chunk = None if self.dry_run else forward
+        # on_created/on_closed only schedule files that are already complete
+        processed_data = process(file_path, on_chunk=on_chunk, check_ready=False)
 
         if processed_data is not None:
-            records, filename, checksum = processed_data
             if self.dry_run:
+                self._log_preview(file_path, processed_data[0])
                 self.logger.info(f"Dry run: Validated file {file_path}. No data inserted.")
             else:
-                # Convert the list of dicts into a DataFrame before saving
-                df = pd.DataFrame(records)
-                self.db_handler.save_data(df)
+                self.logger.info(f"Queued validated records from {file_path} for the database.")
         else:
             self.logger.info(f"No data processed for file {file_path}.")
 
+    def _handler_for(self, ext: str):
+        """
+        Returns this worker thread's handler instance for a file extension, creating it on first use.
+
+        Handlers keep per-file state while processing, so each worker thread gets its own instances
+        instead of one shared instance, and reuses them for every later file.
+        """
+        handlers = getattr(self._thread_handlers, 'handlers', None)
+        if handlers is None:
+            handlers = self._thread_handlers.handlers = {}
+        handler = handlers.get(ext)
+        if handler is None:
+            handler_class = self.file_handlers.get(ext)
+            if handler_class is None:
+                return None
+            handler = handlers[ext] = handler_class()
+        return handler
+
+    def _log_preview(self, file_path: str, rows) -> None:
+        # Formatting the rows is only worth it when a debug record is actually emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            df = rows.head(PREVIEW_ROWS) if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows[:PREVIEW_ROWS])
+            self.logger.debug("File content of %s:\n%s", file_path, df.to_string(index=False))
+
     def on_created(self, event: 'FileSystemEvent') -> None:
         """
         Event handler triggered when a new file is created in the monitored directory.
@@ -126,15 +180,70 @@ class FileMonitorHandler(FileSystemEventHandler):
             return
 
         file_path = event.src_path
+        if not file_path.endswith(self._suffixes):
+            # Unsupported files are dropped here instead of being queued, polled and then rejected
+            self.logger.warning(f"Unsupported file type: {file_path}")
+            return
 
-        if not self.is_file_ready(file_path):
-            self.logger.info(f"File {file_path} is not ready. Will retry later.")
+        if self.wait_for_close:
+            # Processed by on_closed once the writer closes the file
+            self._pending_close.add(file_path)
             return
 
-        self.logger.info(f"File {file_path} is ready. Processing it...")
+        # The readiness poll runs on a worker, not on the observer thread
+        self.schedule_file(file_path, check_ready=True)
 
-        # Schedule the asynchronous task in a thread-safe manner using run_coroutine_threadsafe
-        asyncio.run_coroutine_threadsafe(self.handle_file(file_path), self.loop)
+    def on_closed(self, event: 'FileClosedEvent') -> None:
+        """
+        Event handler triggered when a file opened for writing is closed (inotify `IN_CLOSE_WRITE`).
+        :param event: The file system event object containing details about the closed file.
+        """
+        if event.is_directory or event.src_path not in self._pending_close:
+            return
+
+        # Only the first close of a new file is processed; later rewrites are not new files
+        self._pending_close.discard(event.src_path)
+        self.schedule_file(event.src_path)
+
+    def schedule_file(self, file_path: str, check_ready: bool = False) -> None:
+        """
+        Queues a file for processing on the worker pool.
+
+        A file already queued or being processed is not queued twice. Once `max_pending` files are
+        in flight, this blocks the observer thread until one finishes, so a slow database cannot
+        make the queue grow without bound.
+
+        :param file_path: The path to the file.
+        :param check_ready: If True, the worker first waits for the file to stop changing.
+        """
+        with self._inflight_lock:
+            if file_path in self._inflight:
+                return
+            self._inflight.add(file_path)
+
+        self._slots.acquire()
+        self.logger.info(f"File {file_path} queued for processing.")
+        self.pool.submit(self._process_queued, file_path, check_ready)
+
+    def close(self) -> None:
+        """
+        Waits for the queued files to be processed and stops the worker threads.
+        """
+        self.pool.shutdown(wait=True)
+
+    def _process_queued(self, file_path: str, check_ready: bool) -> None:
+        try:
+            if check_ready and not self.is_file_ready(file_path):
+                self.logger.info(f"File {file_path} is not ready. Will retry later.")
+                return
+            self.logger.info(f"File {file_path} is ready. Processing it...")
+            self.process_path(file_path)
+        except Exception as e:
+            self.logger.error(f"Failed to process file {file_path}: {e}")
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(file_path)
+            self._slots.release()
 
 
 class FolderMonitor:
@@ -168,6 +277,7 @@ class FolderMonitor:
         :param db_handler: Database handler to store the processed file data.
         :param dry_run: If set to True, processes files but skips inserting data into the database.
         :param file_handlers: A dictionary mapping file extensions to handler classes.
+        :param loop: The event loop `start_monitoring` runs on; defaults to the running loop when it starts.
         """
         self.folder_to_monitor = folder_to_monitor
         self.poll_interval = poll_interval
@@ -175,23 +285,51 @@ class FolderMonitor:
         self.logger = setup_logger()
         self.dry_run = dry_run
         self.file_handlers = file_handlers
-        self.loop = loop or asyncio.get_event_loop()
+        # The loop running start_monitoring, unless given here
+        self.loop = loop
+        self._stop_event = None
 
     async def start_monitoring(self) -> None:
         """
         Starts the folder monitoring process by setting up a `watchdog.Observer`.
+
+        The observer blocks on the platform's native notification API (inotify on Linux,
+        kqueue/FSEvents elsewhere), so the event loop sleeps until a file event or
+        `stop_monitoring` instead of waking up every `poll_interval` seconds. The poll
+        interval is used as the observer's read timeout. With inotify, a new file is processed
+        as soon as its writer closes it; other backends poll the file until it stops changing.
         """
         self.logger.info(f"Monitoring folder: {self.folder_to_monitor}")
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        observer = Observer(timeout=self.poll_interval)
+        # inotify reports when a writer closes a file, so new files need no stability polling
+        wait_for_close = type(observer).__name__ == "InotifyObserver"
         event_handler = FileMonitorHandler(self.db_handler, dry_run=self.dry_run,
-                                           file_handlers=self.file_handlers, loop=self.loop)
-        observer = Observer()
-        observer.schedule(event_handler, self.folder_to_monitor, recursive=False)
+                                           file_handlers=self.file_handlers,
+                                           wait_for_close=wait_for_close)
+        # Only subscribe to creation and close-after-write events, so the watch is not woken by
+        # the open/read traffic the file handlers themselves generate when reading files back.
+        event_filter = [FileCreatedEvent, FileClosedEvent] if wait_for_close else [FileCreatedEvent]
+        observer.schedule(event_handler, self.folder_to_monitor, recursive=False,
+                          event_filter=event_filter)
         observer.start()
 
+        self._stop_event = asyncio.Event()
         try:
-            while True:
-                await asyncio.sleep(self.poll_interval)
-        except KeyboardInterrupt:
+            await self._stop_event.wait()
+        finally:
             self.logger.info("Shutting down folder monitoring...")
             observer.stop()
-        observer.join()
+            observer.join()
+            # Finish the files already queued before closing the database writer
+            event_handler.close()
+            # Drain any DataFrames still queued for the database
+            self.db_handler.close()
+
+    def stop_monitoring(self) -> None:
+        """
+        Requests `start_monitoring` to stop. Safe to call from any thread.
+        """
+        if self._stop_event is not None:
+            self.loop.call_soon_threadsafe(self._stop_event.set)
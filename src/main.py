@@ -4,6 +4,7 @@ import os
 import time
 import asyncio
 import pandas as pd
+from dotenv import load_dotenv
 from src.handlers.files_monitor import FolderMonitor
 from src.handlers.db_handlers.mongo_handler import MongoDBHandler
 from src.handlers.db_handlers.postgres_handler import PostgresHandler
@@ -48,8 +49,7 @@ async def run_monitoring():
         poll_interval=2,  # Polling interval in seconds
         db_handler=db_handler,
         dry_run=True,  # Dry-run mode for testing (no actual DB insertion)
-        file_handlers=file_handlers,
-        loop=asyncio.get_running_loop()  # Pass the event loop
+        file_handlers=file_handlers
     )
 
     # Start monitoring the folder asynchronously
@@ -61,18 +61,17 @@ def main():
     The main entry point of the script. Sets up a test environment, demonstrates file creation,
     and starts the folder monitoring process.
     """
+    # Load database settings from the .env file before any handler reads them
+    load_dotenv()
+
     # Step 1: Check if the test folder exists
     check_folder_exists()
 
-    # Step 2: Start the asyncio event loop to monitor the test folder
-    loop = asyncio.get_event_loop()
+    # Step 2: Run the monitoring coroutine on a fresh event loop, closed when it returns
     try:
-        # Start the folder monitoring coroutine
-        loop.run_until_complete(run_monitoring())
+        asyncio.run(run_monitoring())
     except KeyboardInterrupt:
         print("Monitoring stopped.")
-    finally:
-        loop.close()
 
 
 if __name__ == "__main__":
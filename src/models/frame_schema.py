@@ -0,0 +1,127 @@
+# src/models/frame_schema.py
+
+import functools
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+from src.models.row_validator import to_float, to_int, uses_default_serialization, uses_default_validation
+
+
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+class FrameSchema:
+    """
+    Column-wise validator derived from a pydantic model with `str`, `int` and `float` fields.
+
+    Instead of instantiating the model once per row, every field is checked and coerced for the
+    whole DataFrame at once, following pydantic's lax-mode rules: `int` accepts integral floats
+    and numeric strings, `float` accepts any number or numeric string, NaN included, and `str`
+    only accepts strings. Numeric columns are checked with array operations; values of other
+    columns are converted one by one with the row validator's `to_int` and `to_float`, so both
+    paths accept the same strings. Integers outside the 64-bit range are rejected, as the valid
+    rows are returned in int64 columns. Columns that are not model fields are dropped, as
+    `BaseModel.dict()` would.
+
+    :param fields: Mapping of field name to its Python type, in model order.
+    :type fields: Dict[str, type]
+    """
+
+    SUPPORTED_TYPES = (str, int, float)
+
+    def __init__(self, fields: Dict[str, type]) -> None:
+        self.fields = fields
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def for_model(cls, data_model) -> Optional['FrameSchema']:
+        """
+        Builds the schema for a pydantic model, cached per model.
+
+        :param data_model: The pydantic model class.
+        :return: The schema, or None if the model has a field type, constraint, default, validator,
+            configuration or alias that cannot be checked column-wise.
+        :rtype: Optional[FrameSchema]
+        """
+        model_fields = getattr(data_model, 'model_fields', None)
+        if not isinstance(model_fields, dict):
+            return None
+        fields = {name: field.annotation for name, field in model_fields.items()}
+        if not fields or any(annotation not in cls.SUPPORTED_TYPES for annotation in fields.values()):
+            return None
+        # Constrained fields, e.g. Field(ge=0), are left to the row validators, which check them
+        if any(field.metadata for field in model_fields.values()):
+            return None
+        # Every field must come from its column; defaults for missing columns are left to the row validators
+        if not all(field.is_required() for field in model_fields.values()):
+            return None
+        # Validators, config and aliases only run inside pydantic
+        if not uses_default_validation(data_model) or not uses_default_serialization(data_model):
+            return None
+        return cls(fields)
+
+    def validate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Validates and coerces every row of the DataFrame.
+
+        :param df: The DataFrame to validate.
+        :type df: pd.DataFrame
+        :return: The valid rows, coerced to the model's types with only its fields, and a boolean
+            DataFrame flagging the invalid fields of every invalid row.
+        :rtype: Tuple[pd.DataFrame, pd.DataFrame]
+        """
+        columns = {}
+        failures = {}
+        for name, annotation in self.fields.items():
+            if name not in df.columns:
+                columns[name] = pd.Series(None, index=df.index, dtype=object)
+                failures[name] = pd.Series(True, index=df.index)
+                continue
+            columns[name], valid = self._coerce(df[name], annotation)
+            failures[name] = ~valid
+
+        failures = pd.DataFrame(failures, index=df.index)
+        invalid_rows = failures.any(axis=1)
+        valid = pd.DataFrame(columns, index=df.index)[~invalid_rows]
+        for name, annotation in self.fields.items():
+            if annotation is not str:
+                valid[name] = valid[name].astype(np.int64 if annotation is int else np.float64)
+        return valid, failures[invalid_rows]
+
+    @staticmethod
+    def _coerce(column: pd.Series, annotation: type) -> Tuple[pd.Series, pd.Series]:
+        if annotation is str:
+            if pd.api.types.is_string_dtype(column.dtype) and column.dtype != object:
+                # A string dtype only holds strings and missing values, so no value needs inspecting
+                return column, column.notna()
+            if not column.hasnans and pd.api.types.infer_dtype(column) == 'string':
+                return column, pd.Series(True, index=column.index)
+            return column, column.map(lambda value: isinstance(value, str)).astype(bool)
+
+        kind = column.dtype.kind if isinstance(column.dtype, np.dtype) else None
+        if kind in ('b', 'i') or (kind == 'u' and annotation is float):
+            return column, pd.Series(True, index=column.index)
+        if kind == 'u':
+            return column, column <= _INT64_MAX
+        if kind == 'f':
+            if annotation is float:
+                return column, pd.Series(True, index=column.index)
+            # Like pydantic, only integral floats strictly inside the int64 range become ints
+            valid = (column == np.floor(column)) & (column > -2.0 ** 63) & (column < 2.0 ** 63)
+            return column, valid
+
+        convert = to_int if annotation is int else to_float
+        values = []
+        valid = []
+        for value in column.tolist():
+            try:
+                number = convert(value)
+            except (TypeError, ValueError):
+                number = None
+            else:
+                if annotation is int and not _INT64_MIN <= number <= _INT64_MAX:
+                    number = None
+            values.append(number)
+            valid.append(number is not None)
+        return pd.Series(values, index=column.index, dtype=object), pd.Series(valid, index=column.index)
@@ -0,0 +1,237 @@
+# src/models/row_validator.py
+
+import functools
+import re
+import typing
+import annotated_types
+from typing import Callable, Optional
+
+
+# Floats pydantic converts to int lie strictly between these bounds, the range of a 64-bit integer
+_INT_FLOAT_MIN = -2.0 ** 63
+_INT_FLOAT_MAX = 2.0 ** 63
+
+_INT_TEXT = re.compile(r'[+-]?[0-9]+')
+
+# The syntax of Rust's float parser, which pydantic-core uses
+_FLOAT_TEXT = re.compile(r'[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|inf|infinity|nan)', re.IGNORECASE)
+
+
+def _strip_underscores(text: str) -> Optional[str]:
+    # Underscores separating characters are ignored; leading, trailing or doubled ones are invalid
+    if text.startswith('_') or text.endswith('_') or '__' in text:
+        return None
+    return text.replace('_', '')
+
+
+def to_int(value):
+    """
+    Converts a value to `int` as pydantic's lax mode does.
+
+    Accepts integers, booleans, integral floats within the 64-bit range, and strings of ASCII
+    digits with optional sign, surrounding whitespace, separating underscores and a decimal
+    part of zeros, e.g. " 1_000.0 ". Exponents, e.g. "1e3", are rejected.
+
+    :raises TypeError: If the value has a type pydantic does not convert to `int`.
+    :raises ValueError: If the value is not a valid integer.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, (bool, int)):
+        return int(value)
+    if isinstance(value, float):
+        if value.is_integer() and _INT_FLOAT_MIN < value < _INT_FLOAT_MAX:
+            return int(value)
+        raise ValueError(f"{value!r} is not a valid integer")
+    if isinstance(value, str):
+        integral, dot, decimals = value.strip().partition('.')
+        if dot and (not decimals or decimals.strip('0')):
+            raise ValueError(f"{value!r} is not a valid integer")
+        if not _INT_TEXT.fullmatch(integral):
+            stripped = _strip_underscores(integral) if '_' in integral else None
+            if stripped is None or not _INT_TEXT.fullmatch(stripped):
+                raise ValueError(f"{value!r} is not a valid integer")
+            integral = stripped
+        return int(integral)
+    raise TypeError(f"{value!r} is not a valid integer")
+
+
+def to_float(value):
+    """
+    Converts a value to `float` as pydantic's lax mode does.
+
+    Accepts numbers, booleans and strings such as "1e3", ".5", "nan" or "-inf", with surrounding
+    whitespace or, without whitespace, separating underscores, e.g. "1_000.5".
+
+    :raises TypeError: If the value has a type pydantic does not convert to `float`.
+    :raises ValueError: If the value is not a valid number.
+    """
+    if type(value) is float:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if not _FLOAT_TEXT.fullmatch(text):
+            stripped = _strip_underscores(value) if '_' in value else None
+            if stripped is None or not _FLOAT_TEXT.fullmatch(stripped):
+                raise ValueError(f"{value!r} is not a valid number")
+            text = stripped
+        return float(text)
+    raise TypeError(f"{value!r} is not a valid number")
+
+
+def to_str(value):
+    """
+    Accepts a value for a `str` field, which pydantic's lax mode only does for strings.
+
+    :raises TypeError: If the value is not a string.
+    """
+    if isinstance(value, str):
+        return value
+    raise TypeError(f"{value!r} is not a valid string")
+
+
+def _ge(value, bound):
+    if value >= bound:
+        return value
+    raise ValueError(f"{value!r} is not greater than or equal to {bound!r}")
+
+
+def _gt(value, bound):
+    if value > bound:
+        return value
+    raise ValueError(f"{value!r} is not greater than {bound!r}")
+
+
+def _le(value, bound):
+    if value <= bound:
+        return value
+    raise ValueError(f"{value!r} is not less than or equal to {bound!r}")
+
+
+def _lt(value, bound):
+    if value < bound:
+        return value
+    raise ValueError(f"{value!r} is not less than {bound!r}")
+
+
+_CONVERTERS = {int: 'to_int', float: 'to_float', str: 'to_str'}
+
+# Numeric constraints from `Field(ge=..., gt=..., le=..., lt=...)`: check function and bound attribute
+_CHECKS = {
+    annotated_types.Ge: ('_ge', 'ge'),
+    annotated_types.Gt: ('_gt', 'gt'),
+    annotated_types.Le: ('_le', 'le'),
+    annotated_types.Lt: ('_lt', 'lt'),
+}
+
+_MISSING = object()
+
+
+def uses_default_validation(data_model) -> bool:
+    """
+    Tells whether a pydantic model validates its fields with pydantic's defaults alone.
+
+    Field or model validators, a non-default `model_config` (e.g. `strict=True` or
+    `extra="forbid"`) and field aliases all change what `model_validate` accepts or returns, so
+    validators that only read the field annotations must leave such models to pydantic.
+
+    :param data_model: The pydantic model class.
+    :return: True if the model has none of these.
+    :rtype: bool
+    """
+    decorators = data_model.__pydantic_decorators__
+    if (decorators.validators or decorators.field_validators or decorators.root_validators
+            or decorators.model_validators):
+        return False
+    if data_model.model_config:
+        return False
+    return not any(field.alias is not None or field.validation_alias is not None
+                   for field in data_model.model_fields.values())
+
+
+def uses_default_serialization(data_model) -> bool:
+    """
+    Tells whether `model_dump` returns exactly a model's validated field values.
+
+    Serializers, computed fields, `Field(exclude=True)` and `extra="allow"` all add, drop or
+    change values in the dump.
+
+    :param data_model: The pydantic model class.
+    :return: True if the model has none of these.
+    :rtype: bool
+    """
+    decorators = data_model.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers or decorators.computed_fields:
+        return False
+    if data_model.model_config.get('extra') == 'allow':
+        return False
+    return not any(field.exclude for field in data_model.model_fields.values())
+
+
+@functools.lru_cache(maxsize=None)
+def compile_row_validator(data_model) -> Optional[Callable[[dict], dict]]:
+    """
+    Generates a function that validates one record against a pydantic model and returns it as a dict.
+
+    The model's fields are inspected once and turned into straight-line code with one conversion
+    call per field, so validating a row runs no pydantic machinery and no `.dict()` call.
+    Conversions follow pydantic's lax mode for `str`, `int` and `float`, including `Optional`
+    fields, defaults (used as-is, like pydantic, when the column is missing) and `ge`/`gt`/`le`/`lt`
+    bounds. Invalid records raise `KeyError`, `TypeError` or `ValueError`. Models with their own
+    validators, configuration, aliases or serialization, or with a `default_factory`, which
+    pydantic calls for every row, are left to pydantic.
+
+    :param data_model: The pydantic model class.
+    :return: The validator, or None if the model has a field type or constraint it does not handle.
+    :rtype: Optional[Callable[[dict], dict]]
+    """
+    model_fields = getattr(data_model, 'model_fields', None)
+    if not isinstance(model_fields, dict) or not model_fields:
+        return None
+    if not uses_default_validation(data_model) or not uses_default_serialization(data_model):
+        return None
+
+    namespace = {'to_int': to_int, 'to_float': to_float, 'to_str': to_str,
+                 '_ge': _ge, '_gt': _gt, '_le': _le, '_lt': _lt, '_MISSING': _MISSING}
+    reads = []
+    entries = []
+    for index, (name, field) in enumerate(model_fields.items()):
+        annotation = field.annotation
+        optional = False
+        if typing.get_origin(annotation) is typing.Union:
+            members = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(members) != 1 or len(typing.get_args(annotation)) != 2:
+                return None
+            annotation = members[0]
+            optional = True
+        converter = _CONVERTERS.get(annotation)
+        if converter is None:
+            return None
+
+        value = f"{converter}(v{index})"
+        for position, constraint in enumerate(field.metadata):
+            check = _CHECKS.get(type(constraint))
+            if check is None or annotation is str:
+                return None
+            namespace[f'_bound_{index}_{position}'] = getattr(constraint, check[1])
+            value = f"{check[0]}({value}, _bound_{index}_{position})"
+        if optional:
+            value = f"None if v{index} is None else {value}"
+
+        if field.is_required():
+            reads.append(f"    v{index} = record[{name!r}]")
+        elif field.default_factory is not None:
+            # pydantic calls the factory for every instance, e.g. to generate ids
+            return None
+        else:
+            namespace[f'_default_{index}'] = field.default
+            reads.append(f"    v{index} = record.get({name!r}, _MISSING)")
+            value = f"_default_{index} if v{index} is _MISSING else ({value})"
+        entries.append(f"        {name!r}: {value},")
+
+    source = ("def validate(record):\n" + "\n".join(reads) + "\n    return {\n" + "\n".join(entries)
+              + "\n    }\n")
+    exec(compile(source, f"<row validator for {data_model.__name__}>", "exec"), namespace)
+    return namespace['validate']
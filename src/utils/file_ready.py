@@ -0,0 +1,50 @@
+# src/utils/file_ready.py
+import os
+import time
+
+
+def wait_until_stable(file_path: str, settle: float = 1.0, timeout: float = 30.0,
+                      interval: float = 0.05) -> bool:
+    """
+    Waits until a file has not been written to for `settle` seconds.
+
+    A file whose modification time is already `settle` seconds old is ready at once, without
+    sleeping. That shortcut compares the file's mtime with this host's clock, so it assumes the
+    clocks of this host and of a NAS serving the file agree to within `settle` seconds; a NAS
+    clock running behind can make a file still being written look old. Otherwise the file is
+    re-stat'ed until its size and modification time have stayed the same for `settle` seconds,
+    which only compares successive stats. The first re-stat happens after `interval` seconds and
+    the wait doubles while the file stays unchanged (50ms, 100ms, 200ms, ...), never sleeping past
+    the moment the file would become stable; a write resets it to `interval`.
+
+    :param file_path: The path to the file.
+    :type file_path: str
+    :param settle: Seconds without writes after which the file counts as complete.
+    :type settle: float
+    :param timeout: Maximum number of seconds to wait.
+    :type timeout: float
+    :param interval: Seconds before the first re-stat, and after each detected write.
+    :type interval: float
+    :return: True if the file became stable within the timeout, False otherwise.
+    :rtype: bool
+    :raises OSError: If the file cannot be stat'ed.
+    """
+    st = os.stat(file_path)
+    unchanged_since = time.monotonic()
+    deadline = unchanged_since + timeout
+    delay = interval
+    while True:
+        if time.time() - st.st_mtime >= settle:
+            return True
+        now = time.monotonic()
+        if now - unchanged_since >= settle:
+            return True
+        if now >= deadline:
+            return False
+        time.sleep(max(0.0, min(delay, unchanged_since + settle - now, deadline - now)))
+        delay *= 2
+        new_st = os.stat(file_path)
+        if (new_st.st_size, new_st.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+            st = new_st
+            unchanged_since = time.monotonic()
+            delay = interval
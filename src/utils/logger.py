@@ -1,13 +1,22 @@
 # src/utils/logger.py
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+# lru_cache does not stop two threads from making the first call at the same time
+_setup_lock = threading.Lock()
 
+
+@functools.lru_cache(maxsize=1)
 def setup_logger():
     """
     Sets up a centralized logger for the application.
-    Ensures logging only happens once for the entire app.
+    Ensures logging only happens once for the entire app; the configured logger
+    is cached, so later calls return it without re-reading the environment.
     """
     logger = logging.getLogger("app_logger")
 
@@ -15,24 +24,30 @@ def setup_logger():
     log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
     logger.setLevel(getattr(logging, log_level, logging.DEBUG))
 
-    # Prevent multiple handlers if the logger is already configured
-    if not logger.handlers:
-        # Create console handler with a higher log level
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-
-        # Create file handler for logging to a file
-        log_file = os.getenv("LOG_FILE", "application.log")
-        fh = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
-        fh.setLevel(logging.ERROR)
-
-        # Create a logging format
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        ch.setFormatter(formatter)
-        fh.setFormatter(formatter)
-
-        # Add the handlers to the logger
-        logger.addHandler(ch)
-        logger.addHandler(fh)
+    # Prevent multiple handlers if the logger is already configured, even by concurrent first calls
+    with _setup_lock:
+        if not logger.handlers:
+            # Create console handler with a higher log level
+            ch = logging.StreamHandler()
+            ch.setLevel(logging.INFO)
+
+            # Create file handler for logging to a file
+            log_file = os.getenv("LOG_FILE", "application.log")
+            fh = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
+            fh.setLevel(logging.ERROR)
+
+            # Create a logging format
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            ch.setFormatter(formatter)
+            fh.setFormatter(formatter)
+
+            # Worker threads only put records on a queue; one listener thread formats them and
+            # does the console and file I/O, including rotation, so logging never blocks the caller
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+            listener = QueueListener(log_queue, ch, fh, respect_handler_level=True)
+            listener.start()
+            # Write out the queued records when the interpreter exits
+            atexit.register(listener.stop)
 
     return logger
\ No newline at end of file
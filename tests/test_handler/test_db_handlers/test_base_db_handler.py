@@ -0,0 +1,157 @@
+import pandas as pd
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from src.handlers.db_handlers.base_db_handler import BaseDBHandler, IngestWriter
+
+
+class RecordingDBHandler(BaseDBHandler):
+    """
+    Minimal concrete handler that records every saved DataFrame.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.saved = []
+
+    def insert_records(self, records):
+        self.saved.append(records)
+
+    def save_data(self, df):
+        self.saved.append(df)
+
+
+def test_ingest_writer_writes_batches_in_order():
+    """
+    Test that IngestWriter hands every queued batch to the sink before close returns.
+    """
+    written = []
+    writer = IngestWriter(written.append, maxsize=2)
+
+    for i in range(5):
+        writer.enqueue(i)
+    writer.close()
+
+    assert written == [0, 1, 2, 3, 4]
+
+
+def test_ingest_writer_survives_sink_failure():
+    """
+    Test that a failing batch is logged, later batches are still written, and flush raises the failure.
+    """
+    written = []
+
+    def sink(batch):
+        if batch == "bad":
+            raise Exception("Mocked write failure")
+        written.append(batch)
+
+    writer = IngestWriter(sink)
+    with mock.patch.object(writer.logger, "error") as mock_log_error:
+        writer.enqueue("bad")
+        writer.enqueue("good")
+        with pytest.raises(Exception, match="Mocked write failure"):
+            writer.flush()
+        mock_log_error.assert_called_once_with("Background write failed: Mocked write failure")
+    writer.close()
+
+    assert written == ["good"]
+
+
+def test_enqueue_saves_data_in_background():
+    """
+    Test that BaseDBHandler.enqueue routes DataFrames to save_data and close drains the queue.
+    """
+    handler = RecordingDBHandler()
+    df = pd.DataFrame({"name": ["Alice"], "age": [24]})
+
+    handler.enqueue(df)
+    handler.close()
+
+    assert len(handler.saved) == 1
+    assert handler.saved[0] is df
+    assert handler._writer is None
+
+
+def test_prepare_insert_is_cached():
+    """
+    Test that the INSERT statement is built from the column order and reused for the same schema.
+    """
+    BaseDBHandler._prepare_insert.cache_clear()
+
+    query = BaseDBHandler._prepare_insert("people", ("name", "age"))
+    BaseDBHandler._prepare_insert("people", ("name", "age"))
+
+    assert query == "INSERT INTO people (name, age) VALUES (%s, %s)"
+    assert BaseDBHandler._prepare_insert.cache_info().hits == 1
+
+
+def test_ingest_writer_coalesces_queued_dataframes():
+    """
+    Test that DataFrames with the same columns queued together are written with one sink call, in order.
+    """
+    written = []
+    writer = IngestWriter(written.append, maxsize=8, linger=0.5)
+
+    writer.enqueue(pd.DataFrame({"name": ["Alice"], "age": [24]}))
+    writer.enqueue(pd.DataFrame({"name": ["Bob"], "age": [25]}))
+    writer.enqueue(pd.DataFrame({"product": ["A"]}))
+    writer.close()
+
+    assert [df.to_dict(orient="records") for df in written] == [
+        [{"name": "Alice", "age": 24}, {"name": "Bob", "age": 25}],
+        [{"product": "A"}],
+    ]
+
+
+def test_enqueue_routes_record_lists_to_insert_records():
+    """
+    Test that a queued list of records is written with insert_records rather than save_data.
+    """
+    handler = RecordingDBHandler()
+    records = [{"name": "Alice", "age": 24}]
+
+    handler.enqueue(records)
+    handler.close()
+
+    assert handler.saved == [records]
+
+
+def test_close_raises_failed_background_write():
+    """
+    Test that a write failing after the last flush is raised by close, once.
+    """
+    def sink(batch):
+        raise ValueError("connection lost")
+
+    writer = IngestWriter(sink)
+    writer.enqueue("batch")
+
+    with pytest.raises(ValueError, match="connection lost"):
+        writer.close()
+    writer.flush()
+
+
+def test_concurrent_first_enqueues_share_one_writer():
+    """
+    Test that threads enqueueing their first batch at the same time all get the same writer.
+    """
+    def slow_writer(sink):
+        time.sleep(0.05)
+        return mock.Mock()
+
+    handler = RecordingDBHandler()
+    start = threading.Barrier(4)
+
+    def first_access():
+        start.wait()
+        return handler.writer
+
+    with mock.patch("src.handlers.db_handlers.base_db_handler.IngestWriter", side_effect=slow_writer) as writer_class:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            writers = list(pool.map(lambda _: first_access(), range(4)))
+
+    writer_class.assert_called_once()
+    assert all(writer is writers[0] for writer in writers)
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import pyarrow as pa
 import os
 from unittest import mock
 from src.handlers.db_handlers.mongo_handler import MongoDBHandler
@@ -27,6 +28,34 @@ def test_mongo_handler_init(mongo_handler):
     assert mongo_handler.client is not None
     assert mongo_handler.db.name == "test_database"
     assert mongo_handler.collection.name == "test_collection"
+    assert mongo_handler.collection.write_concern.document == {"w": 1, "j": False}
+
+
+def test_mongo_handler_reuses_client(mongo_handler):
+    """
+    Test that handlers connecting to the same URI share one MongoClient.
+    """
+    with mock.patch.dict(os.environ, {"MONGODB_URI": "mongodb://mocked_uri:27017/"}):
+        other_handler = MongoDBHandler()
+
+    assert other_handler.client is mongo_handler.client
+
+
+@mock.patch("pymongo.database.Database.create_collection")
+def test_mongo_handler_creates_timeseries_collection(mock_create_collection):
+    """
+    Test that MONGODB_TIMESERIES_FIELD makes the handler create a time series collection.
+    """
+    with mock.patch.dict(os.environ, {
+        "MONGODB_URI": "mongodb://mocked_uri:27017/",
+        "MONGODB_COLLECTION": "test_timeseries",
+        "MONGODB_TIMESERIES_FIELD": "ts"
+    }):
+        MongoDBHandler()
+
+    mock_create_collection.assert_called_once_with(
+        "test_timeseries", timeseries={"timeField": "ts", "granularity": "seconds"}
+    )
 
 
 @mock.patch("pymongo.collection.Collection.insert_many")
@@ -41,8 +70,8 @@ def test_insert_records_success(mock_insert_many, mongo_handler):
     # Call insert_records
     mongo_handler.insert_records(records)
 
-    # Ensure insert_many is called once
-    mock_insert_many.assert_called_once_with(records)
+    # Ensure insert_many is called once, as an unordered batch
+    mock_insert_many.assert_called_once_with(records, ordered=False)
 
     # Check logger outputs (assuming INFO logging level)
     with mock.patch.object(mongo_handler.logger, "info") as mock_log_info:
@@ -69,6 +98,23 @@ def test_insert_records_failure(mock_insert_many, mongo_handler):
         mock_log_error.assert_called_once_with("Failed to insert data into MongoDB: Mocked insert failure")
 
 
+@mock.patch("pymongo.collection.Collection.insert_many")
+def test_insert_records_in_batches(mock_insert_many, mongo_handler):
+    """
+    Test that insert_records splits records into batches of batch_size documents.
+    """
+    records = [{"name": f"user{i}", "age": i} for i in range(5)]
+    mongo_handler.batch_size = 2
+
+    mongo_handler.insert_records(records)
+
+    assert mock_insert_many.call_args_list == [
+        mock.call(records[0:2], ordered=False),
+        mock.call(records[2:4], ordered=False),
+        mock.call(records[4:5], ordered=False),
+    ]
+
+
 def test_save_data(mongo_handler):
     """
     Test MongoDBHandler's save_data method.
@@ -82,5 +128,59 @@ def test_save_data(mongo_handler):
         mongo_handler.save_data(df)
         # Verify that insert_records was called with the correct data
         records = df.to_dict(orient="records")
-        mock_insert_records.assert_called_once_with(records)
+        mock_insert_records.assert_called_once()
+        assert list(mock_insert_records.call_args.args[0]) == records
+
+
+def test_iter_chunks():
+    """
+    Test that _iter_chunks converts the DataFrame in bounded chunks of records.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob", "Carol"], "age": [24, 30, 41]})
+
+    chunks = list(MongoDBHandler._iter_chunks(df, chunk_size=2))
+
+    assert chunks == [
+        [{"name": "Alice", "age": 24}, {"name": "Bob", "age": 30}],
+        [{"name": "Carol", "age": 41}],
+    ]
+
+
+def test_iter_chunks_falls_back_for_mixed_types():
+    """
+    Test that chunks Arrow cannot convert are still converted with DataFrame.to_dict.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob"], "code": [7, "B7"]})
+
+    chunks = list(MongoDBHandler._iter_chunks(df))
+
+    assert chunks == [[{"name": "Alice", "code": 7}, {"name": "Bob", "code": "B7"}]]
+
+
+def test_iter_chunks_converts_the_dataframe_once(mocker):
+    """
+    Test that the DataFrame is converted to Arrow in one call however many chunks it yields.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob", "Carol"], "age": [24, 30, 41]})
+    arrow = mocker.patch("src.handlers.db_handlers.mongo_handler.pa", wraps=pa)
+
+    chunks = list(MongoDBHandler._iter_chunks(df, chunk_size=1))
+
+    assert arrow.Table.from_pandas.call_count == 1
+    assert [record for chunk in chunks for record in chunk] == df.to_dict(orient="records")
+
+
+def test_iter_chunks_fallback_turns_missing_values_into_none():
+    """
+    Test that chunks converted without Arrow encode missing values as None rather than NaN.
+    """
+    df = pd.DataFrame({"code": [7, "B7", None], "price": [1.5, float("nan"), 2.0]})
+
+    chunks = list(MongoDBHandler._iter_chunks(df))
 
+    assert chunks == [[
+        {"code": 7, "price": 1.5},
+        {"code": "B7", "price": None},
+        {"code": None, "price": 2.0},
+    ]]
+    assert type(chunks[0][0]["code"]) is int
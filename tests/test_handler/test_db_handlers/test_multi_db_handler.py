@@ -0,0 +1,63 @@
+import pytest
+import pandas as pd
+from unittest import mock
+from src.handlers.db_handlers.multi_db_handler import MultiDBHandler
+
+
+@pytest.fixture
+def target_handlers():
+    """
+    Fixture providing two mocked target database handlers.
+    """
+    return [mock.MagicMock(), mock.MagicMock()]
+
+
+def test_save_data_fans_out(target_handlers):
+    """
+    Test that save_data forwards the same DataFrame to every target handler.
+    """
+    multi_handler = MultiDBHandler(target_handlers)
+    df = pd.DataFrame({"name": ["Alice"], "age": [24]})
+
+    multi_handler.save_data(df)
+
+    for handler in target_handlers:
+        handler.save_data.assert_called_once_with(df)
+
+
+def test_insert_records_materializes_once(target_handlers):
+    """
+    Test that a records iterator is materialized so every handler receives all records.
+    """
+    multi_handler = MultiDBHandler(target_handlers)
+    records = [{"name": "Alice", "age": 24}, {"name": "Bob", "age": 30}]
+
+    multi_handler.insert_records(iter(records))
+
+    for handler in target_handlers:
+        handler.insert_records.assert_called_once_with(records)
+
+
+def test_failure_is_raised_after_all_writes(target_handlers):
+    """
+    Test that one failing handler does not stop the others and its error is re-raised.
+    """
+    target_handlers[0].save_data.side_effect = Exception("Mocked save failure")
+    multi_handler = MultiDBHandler(target_handlers)
+    df = pd.DataFrame({"name": ["Alice"], "age": [24]})
+
+    with pytest.raises(Exception, match="Mocked save failure"):
+        multi_handler.save_data(df)
+    target_handlers[1].save_data.assert_called_once_with(df)
+
+
+def test_close_closes_targets(target_handlers):
+    """
+    Test that closing the fan-out handler closes every target handler.
+    """
+    multi_handler = MultiDBHandler(target_handlers)
+
+    multi_handler.close()
+
+    for handler in target_handlers:
+        handler.close.assert_called_once()
@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+import os
+from unittest import mock
+from src.handlers.db_handlers.postgres_handler import PostgresHandler
+
+
+@pytest.fixture
+def postgres_handler():
+    """
+    Fixture to create an instance of PostgresHandler with a mocked connection.
+    """
+    with mock.patch.dict(os.environ, {"POSTGRES_TABLE": "test_table"}), \
+            mock.patch("psycopg2.connect") as mock_connect:
+        yield PostgresHandler()
+        mock_connect.assert_called_once()
+
+
+def test_save_data_uses_copy(postgres_handler):
+    """
+    Test PostgresHandler's save_data method.
+    Verify that the DataFrame is streamed with a single COPY and committed once.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [24, 30], "city": ["Taipei", "Tainan"]})
+
+    postgres_handler.save_data(df)
+
+    postgres_handler.cursor.copy_expert.assert_called_once()
+    query, buffer = postgres_handler.cursor.copy_expert.call_args.args
+    assert query == "COPY test_table FROM STDIN WITH CSV"
+    assert buffer.getvalue() == "Alice,24,Taipei\nBob,30,Tainan\n"
+    postgres_handler.cursor.execute.assert_not_called()
+    postgres_handler.connection.commit.assert_called_once()
+
+
+def test_save_data_failure_rolls_back(postgres_handler):
+    """
+    Test that a failed COPY is logged, rolled back and raised.
+    """
+    df = pd.DataFrame({"name": ["Alice"], "age": [24], "city": ["Taipei"]})
+    postgres_handler.cursor.copy_expert.side_effect = Exception("Mocked copy failure")
+
+    with mock.patch.object(postgres_handler.logger, "error") as mock_log_error:
+        with pytest.raises(Exception, match="Mocked copy failure"):
+            postgres_handler.save_data(df)
+        mock_log_error.assert_called_once_with("Failed to insert data into PostgreSQL: Mocked copy failure")
+    postgres_handler.connection.rollback.assert_called_once()
+
+
+@mock.patch("psycopg2.extras.execute_values")
+def test_insert_records_uses_execute_values(mock_execute_values, postgres_handler):
+    """
+    Test PostgresHandler's insert_records method.
+    Verify that records are sent through execute_values in pages.
+    """
+    records = [("Alice", 24, "Taipei"), ("Bob", 30, "Tainan")]
+
+    postgres_handler.insert_records(records)
+
+    mock_execute_values.assert_called_once_with(
+        postgres_handler.cursor,
+        "INSERT INTO test_table VALUES %s",
+        records,
+        page_size=5000
+    )
+    postgres_handler.connection.commit.assert_called_once()
+
+
+def test_failed_background_save_is_raised_by_flush(postgres_handler):
+    """
+    Test that a DataFrame the cursor fails to save in the background makes flush raise.
+    """
+    df = pd.DataFrame({"name": ["Alice"], "age": [24], "city": ["Taipei"]})
+    postgres_handler.cursor.copy_expert.side_effect = Exception("Mocked copy failure")
+
+    postgres_handler.enqueue(df)
+
+    with pytest.raises(Exception, match="Mocked copy failure"):
+        postgres_handler.flush()
+    postgres_handler.connection.rollback.assert_called_once()
+    postgres_handler.close()
@@ -0,0 +1,83 @@
+import pytest
+import pandas as pd
+import os
+from unittest import mock
+from src.handlers.db_handlers.snowflake_handler import SnowflakeHandler
+
+
+@pytest.fixture
+def snowflake_handler():
+    """
+    Fixture to create an instance of SnowflakeHandler with a mocked connection.
+    """
+    with mock.patch.dict(os.environ, {"SNOWFLAKE_TABLE": "TEST_TABLE"}), \
+            mock.patch("snowflake.connector.connect"):
+        yield SnowflakeHandler()
+
+
+@mock.patch("src.handlers.db_handlers.snowflake_handler.write_pandas")
+def test_save_data_uses_write_pandas(mock_write_pandas, snowflake_handler):
+    """
+    Test SnowflakeHandler's save_data method.
+    Verify that the DataFrame is bulk loaded with write_pandas instead of per-row inserts.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [24, 30], "city": ["Taipei", "Tainan"]})
+    mock_write_pandas.return_value = (True, 1, 2, [])
+    snowflake_handler.bulk_load_threshold = 0
+
+    snowflake_handler.save_data(df)
+
+    mock_write_pandas.assert_called_once()
+    conn, saved_df, table_name = mock_write_pandas.call_args.args
+    assert conn is snowflake_handler.conn
+    assert saved_df is df
+    assert table_name == "TEST_TABLE"
+    snowflake_handler.conn.cursor.assert_not_called()
+    snowflake_handler.conn.commit.assert_called_once()
+
+
+@mock.patch("src.handlers.db_handlers.snowflake_handler.write_pandas")
+def test_save_data_failure_is_logged(mock_write_pandas, snowflake_handler):
+    """
+    Test that a failed load reported by write_pandas is logged, raised and not committed.
+    """
+    df = pd.DataFrame({"name": ["Alice"], "age": [24], "city": ["Taipei"]})
+    mock_write_pandas.return_value = (False, 1, 0, [])
+    snowflake_handler.bulk_load_threshold = 0
+
+    with mock.patch.object(snowflake_handler.logger, "error") as mock_log_error:
+        with pytest.raises(RuntimeError):
+            snowflake_handler.save_data(df)
+        mock_log_error.assert_called_once()
+    snowflake_handler.conn.commit.assert_not_called()
+
+
+@mock.patch("src.handlers.db_handlers.snowflake_handler.write_pandas")
+def test_save_data_small_frame_uses_single_insert(mock_write_pandas, snowflake_handler):
+    """
+    Test that DataFrames below bulk_load_threshold are sent as one batched INSERT.
+    """
+    df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [24, 30], "city": ["Taipei", "Tainan"]})
+
+    snowflake_handler.save_data(df)
+
+    mock_write_pandas.assert_not_called()
+    cursor = snowflake_handler.conn.cursor.return_value
+    cursor.executemany.assert_called_once_with(
+        "INSERT INTO TEST_TABLE (name, age, city) VALUES (%s, %s, %s)",
+        [("Alice", 24, "Taipei"), ("Bob", 30, "Tainan")]
+    )
+    snowflake_handler.conn.commit.assert_called_once()
+
+
+def test_insert_records_inserts_tuples_into_configured_table(snowflake_handler):
+    """
+    Test that tuple records are inserted into the configured table in its column order.
+    """
+    records = [("Alice", 24, "Taipei"), ("Bob", 30, "Tainan")]
+
+    snowflake_handler.insert_records(records)
+
+    cursor = snowflake_handler.conn.cursor.return_value
+    cursor.executemany.assert_called_once_with("INSERT INTO TEST_TABLE VALUES (%s, %s, %s)", records)
+    snowflake_handler.conn.commit.assert_called_once()
@@ -0,0 +1,51 @@
+import hashlib
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+
+
+def test_submit_returns_sha256_for_each_file(tmp_path):
+    """
+    Test that every submitted file resolves to the SHA-256 digest of its own bytes.
+    """
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file{i}.csv"
+        path.write_bytes(b"x" * (i * 1000 + 1))
+        paths.append(path)
+    hasher = BulkHasher(batch_size=3)
+
+    futures = [hasher.submit(str(path)) for path in paths]
+    checksums = [future.result(timeout=5) for future in futures]
+    hasher.close()
+
+    assert checksums == [hashlib.sha256(path.read_bytes()).hexdigest() for path in paths]
+
+
+def test_submit_missing_file_resolves_to_none(tmp_path):
+    """
+    Test that a file which cannot be read resolves to None instead of raising.
+    """
+    hasher = BulkHasher()
+
+    checksum = hasher.submit(str(tmp_path / "missing.csv")).result(timeout=5)
+    hasher.close()
+
+    assert checksum is None
+
+
+def test_checksum_cache_skips_unchanged_files(tmp_path, mocker):
+    """
+    Test that an unchanged file is hashed once and a modified file is hashed again.
+    """
+    file_path = tmp_path / "file.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+    cache = ChecksumCache()
+    compute = mocker.Mock(side_effect=lambda path: hashlib.sha256(open(path, "rb").read()).hexdigest())
+
+    first = cache.get_or_compute(str(file_path), compute)
+    assert cache.get_or_compute(str(file_path), compute) == first
+    assert compute.call_count == 1
+
+    file_path.write_bytes(b"a,b\n1,2\n3,4\n")
+    assert cache.get_or_compute(str(file_path), compute) == hashlib.sha256(file_path.read_bytes()).hexdigest()
+    assert compute.call_count == 2
@@ -0,0 +1,600 @@
+import builtins
+import dataclasses
+import datetime
+import hashlib
+import time
+import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from src.handlers.file_fetch_handlers.base_file_fetcher_handler import (_record_dumper, _validate_rows,
+                                                                          _validation_pool, read_ahead)
+from src.handlers.file_fetch_handlers.bulk_hasher import BulkHasher
+from src.handlers.file_fetch_handlers.checksum_cache import ChecksumCache
+from src.handlers.file_fetch_handlers.csv_fetch_handler import CSVFetchHandler
+from src.handlers.file_fetch_handlers.fingerprint_index import FingerprintIndex
+from src.models.data_record import DataRecordCSV
+
+
+def write_csv(path, rows):
+    """
+    Writes rows of people data to a CSV file.
+    """
+    lines = ["name,age,city"] + [f"{row['name']},{row['age']},{row['city']}" for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def sample_rows(count):
+    """
+    Builds count valid people records.
+    """
+    return [{"name": f"user{i}", "age": 20 + i, "city": "Taipei"} for i in range(count)]
+
+
+def test_iter_chunks_reads_in_chunks(tmp_path):
+    """
+    Test that a CSV file is parsed in chunks of chunk_rows rows.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(5))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2)
+
+    chunks = list(handler.iter_chunks(str(file_path)))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_calculate_checksum_is_sha256(tmp_path):
+    """
+    Test that the file checksum is the SHA-256 digest of its bytes.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV)
+
+    assert handler.calculate_checksum(str(file_path)) == hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def test_process_file_forwards_chunks(tmp_path, mocker):
+    """
+    Test that process_file hands each validated chunk to on_chunk instead of accumulating it.
+    """
+    rows = sample_rows(3)
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, rows)
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2)
+    mocker.patch.object(handler, "is_file_ready", return_value=True)
+    received = []
+
+    records, filename, checksum = handler.process_file(str(file_path), on_chunk=received.append)
+
+    assert received == [rows[0:2], rows[2:3]]
+    assert records == []
+    assert filename == "people.csv"
+    assert checksum is not None
+
+
+def test_schema_cache_reuses_inferred_dtypes(tmp_path, mocker):
+    """
+    Test that dtypes inferred for a header are cached and passed to later reads of the same header.
+    """
+    schema_cache = {}
+    first_file = tmp_path / "first.csv"
+    second_file = tmp_path / "second.csv"
+    write_csv(first_file, sample_rows(2))
+    write_csv(second_file, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV, schema_cache=schema_cache)
+
+    list(handler.iter_chunks(str(first_file)))
+    assert list(schema_cache) == [b"name,age,city"]
+
+    read_csv = mocker.spy(handler, "_read_chunks")
+    chunks = list(handler.iter_chunks(str(second_file)))
+
+    assert read_csv.call_args.kwargs["dtype"] == schema_cache[b"name,age,city"]
+    assert chunks[0].to_dict(orient="records") == sample_rows(3)
+
+
+def test_schema_cache_mismatch_reinfers_remaining_rows(tmp_path):
+    """
+    Test that a file no longer matching the cached dtypes is re-read with inference, without losing rows.
+    """
+    schema_cache = {}
+    write_csv(tmp_path / "first.csv", sample_rows(2))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, schema_cache=schema_cache)
+    list(handler.iter_chunks(str(tmp_path / "first.csv")))
+
+    mismatched = tmp_path / "mismatched.csv"
+    mismatched.write_text("name,age,city\nuser0,20,Taipei\nuser1,21,Taipei\nuser2,unknown,Taipei\n")
+    chunks = list(handler.iter_chunks(str(mismatched)))
+
+    rows = [row for chunk in chunks for row in chunk.to_dict(orient="records")]
+    assert [row["name"] for row in rows] == ["user0", "user1", "user2"]
+    assert rows[2]["age"] == "unknown"
+
+
+def test_pyarrow_engine_matches_pandas(tmp_path):
+    """
+    Test that the pyarrow engine yields the same chunks as pandas, including skipped rows.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(5))
+    pandas_handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, engine="pandas")
+    arrow_handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, engine="pyarrow")
+
+    for skip_rows in (0, 3):
+        expected = [chunk.to_dict(orient="records")
+                    for chunk in pandas_handler._read_chunks(str(file_path), skip_rows=skip_rows)]
+        chunks = [chunk.to_dict(orient="records")
+                  for chunk in arrow_handler._read_chunks(str(file_path), skip_rows=skip_rows)]
+        assert chunks == expected
+    assert arrow_handler.read_file(str(file_path)).to_dict(orient="records") == sample_rows(5)
+
+
+def test_pyarrow_engine_keeps_strings_in_arrow(tmp_path):
+    """
+    Test that the pyarrow engine yields Arrow-backed string columns that still validate like pandas' objects.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, engine="pyarrow")
+
+    chunk = next(handler.iter_chunks(str(file_path)))
+
+    assert isinstance(chunk["name"].dtype, pd.ArrowDtype)
+    assert handler.validate_records(chunk) == sample_rows(2)
+
+
+def test_pyarrow_engine_reads_date_like_text_as_str_fields(tmp_path):
+    """
+    Test that text pyarrow would infer as dates or booleans stays a string for the model's str fields.
+    """
+    file_path = tmp_path / "people.csv"
+    rows = [{"name": "2024-01-01", "age": 20, "city": "true"}, {"name": "user1", "age": 21, "city": "false"}]
+    write_csv(file_path, rows)
+    pandas_handler = CSVFetchHandler(DataRecordCSV, engine="pandas")
+    handler = CSVFetchHandler(DataRecordCSV, engine="pyarrow")
+
+    assert handler.process_file(str(file_path), check_ready=False)[0] == rows
+    assert pandas_handler.read_file(str(file_path))["name"].tolist() == ["2024-01-01", "user1"]
+
+
+def test_pyarrow_engine_uses_cached_schema(tmp_path):
+    """
+    Test that the pyarrow engine reuses the schema cache and falls back when a file no longer fits it.
+    """
+    schema_cache = {}
+    write_csv(tmp_path / "first.csv", sample_rows(2))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, schema_cache=schema_cache, engine="pyarrow")
+    list(handler.iter_chunks(str(tmp_path / "first.csv")))
+    assert list(schema_cache) == [b"name,age,city"]
+
+    mismatched = tmp_path / "mismatched.csv"
+    mismatched.write_text("name,age,city\nuser0,20,Taipei\nuser1,21,Taipei\nuser2,unknown,Taipei\n")
+    rows = [row for chunk in handler.iter_chunks(str(mismatched)) for row in chunk.to_dict(orient="records")]
+
+    assert [row["name"] for row in rows] == ["user0", "user1", "user2"]
+    assert rows[2]["age"] == "unknown"
+
+
+def test_read_ahead_preserves_chunk_order(tmp_path):
+    """
+    Test that chunks read ahead on the I/O pool are yielded in file order.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(7))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2)
+
+    chunks = list(read_ahead(handler.iter_chunks(str(file_path))))
+
+    assert [row for chunk in chunks for row in chunk.to_dict(orient="records")] == sample_rows(7)
+
+
+def test_read_ahead_stops_producer_when_closed_early():
+    """
+    Test that closing the consumer early stops parsing and closes the chunk iterator.
+    """
+    closed = []
+
+    def chunks():
+        try:
+            for i in range(100):
+                yield pd.DataFrame({"n": [i]})
+        finally:
+            closed.append(True)
+
+    reader = read_ahead(chunks(), depth=2)
+    assert next(reader)["n"].iloc[0] == 0
+    reader.close()
+
+    assert closed == [True]
+
+
+def test_process_file_stops_when_checksum_fails(tmp_path, mocker):
+    """
+    Test that no chunk is forwarded when the file cannot be hashed.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2)
+    mocker.patch.object(handler, "calculate_checksum", return_value=None)
+    received = []
+
+    assert handler.process_file(str(file_path), on_chunk=received.append, check_ready=False) is None
+    assert received == []
+
+
+class CheckedPerson(BaseModel):
+    name: str
+    age: int
+    city: str
+
+    @field_validator("age")
+    @classmethod
+    def adult(cls, value):
+        if value < 18:
+            raise ValueError("under 18")
+        return value
+
+
+def test_validate_records_in_parallel_for_large_chunks(mocker):
+    """
+    Test that large chunks of a model only pydantic can validate are split over the validation pool in order.
+    """
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler.PARALLEL_VALIDATION_MIN_ROWS", 4)
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler.os.cpu_count", return_value=3)
+    pool = ThreadPoolExecutor(max_workers=3)
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler._validation_pool", return_value=pool)
+    handler = CSVFetchHandler(CheckedPerson)
+    rows = sample_rows(10) + [{"name": "bad", "age": "unknown", "city": "Taipei"}]
+
+    assert handler.validate_records(pd.DataFrame(rows)) == sample_rows(10)
+
+
+def test_validate_records_in_process_with_generated_validator(mocker):
+    """
+    Test that large chunks of a model with a generated validator skip the process pool.
+    """
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler.PARALLEL_VALIDATION_MIN_ROWS", 4)
+    pool = mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler._validation_pool")
+    handler = CSVFetchHandler(DataRecordCSV)
+    handler.frame_schema = None
+
+    assert handler.validate_records(pd.DataFrame(sample_rows(10))) == sample_rows(10)
+    pool.assert_not_called()
+
+
+def test_broken_validation_pool_is_replaced(mocker):
+    """
+    Test that a chunk whose worker died is validated in-process and the next chunk gets a new pool.
+    """
+    module = "src.handlers.file_fetch_handlers.base_file_fetcher_handler"
+    mocker.patch(f"{module}.PARALLEL_VALIDATION_MIN_ROWS", 4)
+    mocker.patch(f"{module}.os.cpu_count", return_value=2)
+    broken = mocker.Mock()
+    broken.map.side_effect = BrokenProcessPool("worker died")
+    healthy = ThreadPoolExecutor(max_workers=2)
+    mocker.patch(f"{module}._validation_executor", broken)
+    mocker.patch(f"{module}.ProcessPoolExecutor", return_value=healthy)
+    handler = CSVFetchHandler(CheckedPerson)
+    df = pd.DataFrame(sample_rows(6))
+
+    assert handler.validate_records(df) == sample_rows(6)
+    broken.shutdown.assert_called_once()
+    assert handler.validate_records(df) == sample_rows(6)
+    assert _validation_pool() is healthy
+
+
+def test_validate_rows_reuses_outcome_of_repeated_rows(mocker):
+    """
+    Test that repeated rows are validated once and still yield one record, or one error, each.
+    """
+    validate = mocker.Mock(side_effect=lambda record: DataRecordCSV(**record).model_dump())
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler.compile_row_validator",
+                 return_value=validate)
+    row = {"name": "user0", "age": 20, "city": "Taipei"}
+    records = [row, dict(row), {"name": "user0", "age": 20.0, "city": "Taipei"}, dict(row)]
+
+    validated, errors, reused = _validate_rows(DataRecordCSV, records)
+
+    assert validated == [row] * 4
+    assert errors == []
+    assert reused == 2
+    assert validate.call_count == 2
+
+
+def test_invalid_rows_are_logged_once_per_chunk(mocker):
+    """
+    Test that a chunk's invalid rows are reported in a single error quoting the first ten of them.
+    """
+    handler = CSVFetchHandler(DataRecordCSV)
+    log_error = mocker.patch.object(handler.logger, "error")
+    rows = sample_rows(3) + [{"name": f"bad{i}", "age": "unknown", "city": "Taipei"} for i in range(12)]
+
+    valid = handler.validate_frame(pd.DataFrame(rows))
+
+    assert valid.to_dict(orient="records") == sample_rows(3)
+    log_error.assert_called_once()
+    message = log_error.call_args.args[0]
+    assert message.startswith("Validation failed for 12 of 15 rows")
+    assert "bad9" in message and "bad10" not in message
+
+
+def test_record_dumper_matches_model_dump():
+    """
+    Test that validated instances become the same records as with model_dump, nested models included.
+    """
+    class Point(BaseModel):
+        x: int
+
+    class Flat(BaseModel):
+        at: datetime.date
+        tags: List[str]
+
+    class Nested(BaseModel):
+        point: Optional[Point]
+
+    flat = Flat(at="2024-01-02", tags=["a"])
+    nested = Nested(point={"x": 1})
+
+    assert _record_dumper(Flat)(flat) == flat.model_dump()
+    assert _record_dumper(Nested)(nested) == {"point": {"x": 1}}
+
+
+def test_record_dumper_uses_model_dump_for_custom_serialization():
+    """
+    Test that serializers, excluded fields and allowed extras are dumped as model_dump dumps them.
+    """
+    class Serialized(BaseModel):
+        name: str
+
+        @field_serializer("name")
+        def upper(self, value):
+            return value.upper()
+
+    class Excluded(BaseModel):
+        name: str
+        secret: str = Field(exclude=True)
+
+    class Open(BaseModel):
+        model_config = ConfigDict(extra="allow")
+        name: str
+
+    serialized = Serialized(name="a")
+    excluded = Excluded(name="a", secret="s")
+    extended = Open(name="a", other=1)
+
+    assert _record_dumper(Serialized)(serialized) == {"name": "A"}
+    assert _record_dumper(Excluded)(excluded) == {"name": "a"}
+    assert _record_dumper(Open)(extended) == {"name": "a", "other": 1}
+
+
+def test_construct_mode_keeps_model_columns_without_validating():
+    """
+    Test that construct mode trusts the rows and only keeps the model's columns.
+    """
+    handler = CSVFetchHandler(DataRecordCSV, data_model_mode="construct")
+    df = pd.DataFrame([{"name": "user0", "age": "unknown", "city": "Taipei", "extra": 1}])
+
+    assert handler.validate_records(df) == [{"name": "user0", "age": "unknown", "city": "Taipei"}]
+
+
+def test_dataclass_mode_builds_dataclass_records():
+    """
+    Test that dataclass models are instantiated per row and rows rejected by __post_init__ are skipped.
+    """
+    @dataclasses.dataclass(slots=True)
+    class Person:
+        name: str
+        age: int
+        city: str
+
+        def __post_init__(self):
+            if not isinstance(self.age, int):
+                raise ValueError("age must be an integer")
+
+    handler = CSVFetchHandler(Person)
+    df = pd.DataFrame([{"name": "user0", "age": 20, "city": "Taipei"},
+                       {"name": "user1", "age": "unknown", "city": "Taipei"}])
+
+    assert handler.data_model_mode == "dataclass"
+    assert handler.validate_records(df) == [{"name": "user0", "age": 20, "city": "Taipei"}]
+
+
+def test_process_file_columnar_forwards_validated_frames(tmp_path):
+    """
+    Test that the columnar path hands each chunk's valid rows to on_chunk as a DataFrame.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\nuser0,20,Taipei\nuser1,unknown,Taipei\nuser2,22,Taipei\n")
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2)
+    received = []
+
+    df, filename, checksum = handler.process_file_columnar(str(file_path), on_chunk=received.append,
+                                                           check_ready=False)
+
+    assert all(isinstance(chunk, pd.DataFrame) for chunk in received)
+    assert [row for chunk in received for row in chunk.to_dict(orient="records")] == [
+        {"name": "user0", "age": 20, "city": "Taipei"},
+        {"name": "user2", "age": 22, "city": "Taipei"},
+    ]
+    assert df.empty
+    assert filename == "people.csv"
+
+
+def test_process_file_reads_small_files_once(tmp_path, mocker):
+    """
+    Test that a small file is read from storage once and both hashed and parsed from those bytes.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV, schema_cache={})
+    opened = mocker.spy(builtins, "open")
+
+    records, _, checksum = handler.process_file(str(file_path), check_ready=False)
+
+    assert records == sample_rows(3)
+    assert checksum == hashlib.sha256(file_path.read_bytes()).hexdigest()
+    assert [call.args[0] for call in opened.call_args_list].count(str(file_path)) == 1
+
+
+def test_duplicate_content_is_processed_once(tmp_path):
+    """
+    Test that a file with the same content as one already processed is skipped and recorded as an alias.
+    """
+    original = tmp_path / "people.csv"
+    copy = tmp_path / "people_copy.csv"
+    write_csv(original, sample_rows(3))
+    write_csv(copy, sample_rows(3))
+    fingerprints = FingerprintIndex()
+    handler = CSVFetchHandler(DataRecordCSV, fingerprints=fingerprints)
+
+    records, _, checksum = handler.process_file(str(original), check_ready=False)
+    duplicate = handler.process_file(str(copy), check_ready=False)
+
+    assert records == sample_rows(3)
+    assert duplicate == ([], "people_copy.csv", checksum)
+    assert fingerprints.aliases(checksum) == ["people_copy.csv"]
+
+
+def test_duplicate_content_is_skipped_before_parsing(tmp_path, mocker):
+    """
+    Test that a duplicate file is recognised from its checksum without parsing any of it.
+    """
+    original = tmp_path / "people.csv"
+    copy = tmp_path / "people_copy.csv"
+    write_csv(original, sample_rows(3))
+    write_csv(copy, sample_rows(3))
+    handler = CSVFetchHandler(DataRecordCSV, fingerprints=FingerprintIndex())
+    handler.process_file(str(original), check_ready=False)
+    iter_chunks = mocker.spy(handler, "iter_chunks")
+
+    assert handler.process_file(str(copy), check_ready=False)[0] == []
+    iter_chunks.assert_not_called()
+
+
+def test_failed_file_keeps_claim_once_rows_were_handed_off(tmp_path, mocker):
+    """
+    Test that a copy of a file that failed midway is skipped once some of its rows were saved,
+    but processed if the failure came before any rows were saved.
+    """
+    original = tmp_path / "people.csv"
+    copy = tmp_path / "people_copy.csv"
+    write_csv(original, sample_rows(4))
+    write_csv(copy, sample_rows(4))
+    fingerprints = FingerprintIndex()
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, fingerprints=fingerprints)
+    received = []
+    mocker.patch.object(handler, "validate_records",
+                        side_effect=[sample_rows(2), RuntimeError("disk full")])
+
+    assert handler.process_file(str(original), on_chunk=received.append, check_ready=False) is None
+    assert received == [sample_rows(2)]
+    assert handler.process_file(str(copy), check_ready=False)[0] == []
+
+    other = tmp_path / "other.csv"
+    other_copy = tmp_path / "other_copy.csv"
+    write_csv(other, sample_rows(2))
+    write_csv(other_copy, sample_rows(2))
+    handler.validate_records.side_effect = RuntimeError("disk full")
+    assert handler.process_file(str(other), on_chunk=received.append, check_ready=False) is None
+    handler.validate_records.side_effect = None
+    handler.validate_records.return_value = sample_rows(2)
+    assert handler.process_file(str(other_copy), check_ready=False)[0] == sample_rows(2)
+
+
+def test_fused_read_uses_bulk_hasher_checksum_cache(tmp_path, mocker):
+    """
+    Test that a small file read once still gets checksum cache hits from the bulk hasher's cache.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(3))
+    hasher = BulkHasher(checksum_cache=ChecksumCache())
+    handler = CSVFetchHandler(DataRecordCSV, bulk_hasher=hasher)
+    sha256 = mocker.spy(hashlib, "sha256")
+
+    first = handler.process_file(str(file_path), check_ready=False)[2]
+    second = handler.process_file(str(file_path), check_ready=False)[2]
+    hasher.close()
+
+    assert first == second == hashlib.sha256(file_path.read_bytes()).hexdigest()
+    assert sha256.call_count == 2  # the first process_file, then the expected value above
+
+
+def test_chunked_handler_streams_files_larger_than_a_few_chunks(tmp_path, mocker):
+    """
+    Test that a chunked handler parses a larger file from its path and hashes it through the bulk hasher.
+    """
+    mocker.patch("src.handlers.file_fetch_handlers.base_file_fetcher_handler.FUSED_READ_CHUNKED_MAX_BYTES", 16)
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(4))
+    hasher = BulkHasher()
+    submit = mocker.spy(hasher, "submit")
+    handler = CSVFetchHandler(DataRecordCSV, chunk_rows=2, bulk_hasher=hasher)
+    source = mocker.spy(handler, "source")
+
+    records, _, _ = handler.process_file(str(file_path), check_ready=False)
+    hasher.close()
+
+    assert records == sample_rows(4)
+    submit.assert_called_once_with(str(file_path))
+    assert source.spy_return_list and all(result == str(file_path) for result in source.spy_return_list)
+
+
+def test_file_changed_after_fused_read_is_hashed_again(tmp_path, mocker):
+    """
+    Test that a checksum of bytes read before a write is not cached under the file's new version.
+    """
+    file_path = tmp_path / "people.csv"
+    write_csv(file_path, sample_rows(2))
+    handler = CSVFetchHandler(DataRecordCSV, checksum_cache=ChecksumCache())
+    read_small_file = handler._read_small_file
+
+    def read_then_modify(path):
+        loaded = read_small_file(path)
+        write_csv(file_path, sample_rows(3))
+        os.utime(file_path, ns=(1, 1))
+        return loaded
+
+    mocker.patch.object(handler, "_read_small_file", side_effect=read_then_modify)
+    handler.process_file(str(file_path), check_ready=False)
+    mocker.stopall()
+
+    records, _, checksum = handler.process_file(str(file_path), check_ready=False)
+
+    assert records == sample_rows(3)
+    assert checksum == hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def test_copy_waiting_for_a_failed_file_is_processed(tmp_path, mocker):
+    """
+    Test that a copy arriving while the original is processed waits, and is processed once the original fails.
+    """
+    original = tmp_path / "people.csv"
+    copy = tmp_path / "people_copy.csv"
+    write_csv(original, sample_rows(3))
+    write_csv(copy, sample_rows(3))
+    fingerprints = FingerprintIndex()
+    failing = CSVFetchHandler(DataRecordCSV, fingerprints=fingerprints)
+    claim = mocker.spy(fingerprints, "claim")
+
+    def fail_once_copy_waits(df):
+        # Fail only after the copy has entered claim and is waiting on the original
+        while claim.call_count < 2:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        raise RuntimeError("database down")
+
+    mocker.patch.object(failing, "validate_records", side_effect=fail_once_copy_waits)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(failing.process_file, str(original), check_ready=False)
+        while claim.call_count < 1:
+            time.sleep(0.01)
+        second = pool.submit(CSVFetchHandler(DataRecordCSV, fingerprints=fingerprints).process_file,
+                             str(copy), check_ready=False)
+
+        assert first.result() is None
+        assert second.result()[0] == sample_rows(3)
+    assert fingerprints.aliases(second.result()[2]) == []
@@ -0,0 +1,119 @@
+import pandas as pd
+import pytest
+from src.handlers.file_fetch_handlers.excel_fetch_handler import ExcelFetchHandler
+from src.models.data_record import DataRecordExcel
+
+
+def write_workbook(path, rows):
+    """
+    Writes rows of product data to an .xlsx workbook.
+    """
+    pd.DataFrame(rows).to_excel(path, index=False)
+
+
+def test_iter_chunks_streams_xlsx_in_chunks(tmp_path):
+    """
+    Test that an .xlsx workbook is streamed in chunks of chunk_rows rows.
+    """
+    rows = [{"product": f"P{i}", "price": float(i), "quantity": i} for i in range(5)]
+    file_path = str(tmp_path / "products.xlsx")
+    write_workbook(file_path, rows)
+    handler = ExcelFetchHandler(DataRecordExcel, chunk_rows=2)
+
+    chunks = list(handler.iter_chunks(file_path))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks).to_dict(orient="records") == rows
+
+
+def test_iter_chunks_without_chunk_rows_reads_whole_file(tmp_path):
+    """
+    Test that without chunk_rows the workbook is read in a single DataFrame.
+    """
+    rows = [{"product": "A", "price": 100.0, "quantity": 10}]
+    file_path = str(tmp_path / "products.xlsx")
+    write_workbook(file_path, rows)
+    handler = ExcelFetchHandler(DataRecordExcel)
+
+    chunks = list(handler.iter_chunks(file_path))
+
+    assert len(chunks) == 1
+    assert chunks[0].to_dict(orient="records") == rows
+
+
+def test_process_file_validates_streamed_rows(tmp_path, mocker):
+    """
+    Test that process_file validates every streamed chunk of an .xlsx workbook.
+    """
+    rows = [{"product": f"P{i}", "price": float(i), "quantity": i} for i in range(3)]
+    file_path = str(tmp_path / "products.xlsx")
+    write_workbook(file_path, rows)
+    handler = ExcelFetchHandler(DataRecordExcel, chunk_rows=2)
+    mocker.patch.object(handler, "is_file_ready", return_value=True)
+
+    records, filename, checksum = handler.process_file(file_path)
+
+    assert records == rows
+    assert filename == "products.xlsx"
+    assert checksum is not None
+
+
+def test_read_file_streams_xlsx_without_read_excel(tmp_path, mocker):
+    """
+    Test that read_file builds the DataFrame from openpyxl's read-only rows instead of pd.read_excel.
+    """
+    rows = [{"product": f"P{i}", "price": float(i), "quantity": i} for i in range(3)]
+    file_path = str(tmp_path / "products.xlsx")
+    write_workbook(file_path, rows)
+    mocker.patch("src.handlers.file_fetch_handlers.excel_fetch_handler.CALAMINE_AVAILABLE", False)
+    read_excel = mocker.patch("pandas.read_excel")
+    handler = ExcelFetchHandler(DataRecordExcel)
+
+    df = handler.read_file(file_path)
+
+    read_excel.assert_not_called()
+    assert df.to_dict(orient="records") == rows
+
+
+def test_iter_chunks_streams_xlsx_with_openpyxl_when_calamine_installed(tmp_path, mocker):
+    """
+    Test that with python-calamine installed a chunked .xlsx workbook is still streamed, not read whole.
+    """
+    mocker.patch("src.handlers.file_fetch_handlers.excel_fetch_handler.CALAMINE_AVAILABLE", True)
+    rows = [{"product": f"P{i}", "price": float(i), "quantity": i} for i in range(5)]
+    file_path = str(tmp_path / "products.xlsx")
+    write_workbook(file_path, rows)
+    read_excel = mocker.spy(pd, "read_excel")
+    handler = ExcelFetchHandler(DataRecordExcel, chunk_rows=2)
+
+    chunks = list(handler.iter_chunks(file_path))
+
+    read_excel.assert_not_called()
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks).to_dict(orient="records") == rows
+
+
+def test_iter_chunks_streams_xls_rows_from_calamine(tmp_path, mocker):
+    """
+    Test that workbooks openpyxl cannot stream are chunked from calamine's row iterator.
+    """
+    pytest.importorskip("python_calamine")
+    mocker.patch("src.handlers.file_fetch_handlers.excel_fetch_handler.CALAMINE_AVAILABLE", True)
+    rows = [{"product": f"P{i}", "price": float(i), "quantity": i} for i in range(5)]
+    rows[3]["price"] = None
+    xlsx_path = tmp_path / "products.xlsx"
+    write_workbook(xlsx_path, rows)
+    # calamine detects the format from the content, so an .xlsx renamed to .xls takes the .xls path
+    file_path = str(tmp_path / "products.xls")
+    xlsx_path.rename(file_path)
+    read_excel = mocker.spy(pd, "read_excel")
+    handler = ExcelFetchHandler(DataRecordExcel, chunk_rows=2)
+
+    chunks = list(handler.iter_chunks(file_path))
+
+    read_excel.assert_not_called()
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    records = pd.concat(chunks).to_dict(orient="records")
+    assert pd.isna(records[3].pop("price"))
+    rows[3].pop("price")
+    assert records == rows
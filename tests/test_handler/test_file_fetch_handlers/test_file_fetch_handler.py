@@ -3,7 +3,7 @@ import os
 import pandas as pd
 from unittest import mock
 from pydantic import ValidationError
-from hashlib import md5
+from hashlib import sha256
 from src.handlers.file_fetch_handlers.csv_fetch_handler import CSVFetchHandler
 from src.handlers.file_fetch_handlers.excel_fetch_handler import ExcelFetchHandler
 from src.handlers.file_fetch_handlers.base_file_fetcher_handler import BaseFileFetchHandler
@@ -77,7 +77,7 @@ def test_calculate_checksum(csv_handler):
     Test checksum calculation for a file.
     """
     file_content = b"some file content"  # Change to binary content
-    expected_checksum = md5(file_content).hexdigest()  # No need to encode again
+    expected_checksum = sha256(file_content).hexdigest()  # No need to encode again
     
     with mock_open_file(file_content), mock_getsize([len(file_content)]):
         checksum = csv_handler.calculate_checksum("dummy.csv")
@@ -0,0 +1,176 @@
+import asyncio
+import dataclasses
+import functools
+import threading
+import pandas as pd
+from unittest import mock
+from src.handlers.files_monitor import FileMonitorHandler, FolderMonitor
+from src.handlers.file_fetch_handlers.csv_fetch_handler import CSVFetchHandler
+
+
+def test_handle_file_checks_readiness_only_once(tmp_path, mocker):
+    """
+    Test that a file scheduled by the monitor is not probed for readiness again by the fetch handler.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\nuser0,20,Taipei\n")
+    db_handler = mock.MagicMock()
+    is_file_ready = mocker.patch.object(CSVFetchHandler, "is_file_ready")
+    loop = asyncio.new_event_loop()
+    monitor = FileMonitorHandler(db_handler)
+
+    try:
+        loop.run_until_complete(monitor.handle_file(str(file_path)))
+    finally:
+        loop.close()
+
+    is_file_ready.assert_not_called()
+    db_handler.enqueue.assert_called_once()
+
+
+def test_on_closed_processes_only_new_files(tmp_path, mocker):
+    """
+    Test that with close events a file is scheduled on its first close after creation, without polling.
+    """
+    monitor = FileMonitorHandler(mock.MagicMock(), wait_for_close=True)
+    schedule_file = mocker.patch.object(monitor, "schedule_file")
+    is_file_ready = mocker.patch.object(monitor, "is_file_ready")
+    path = str(tmp_path / "people.csv")
+
+    monitor.on_created(mock.MagicMock(is_directory=False, src_path=path))
+    monitor.on_closed(mock.MagicMock(is_directory=False, src_path=path))
+    monitor.on_closed(mock.MagicMock(is_directory=False, src_path=path))
+
+    schedule_file.assert_called_once_with(path)
+    is_file_ready.assert_not_called()
+
+
+def test_schedule_file_runs_on_worker_pool_once_per_path(mocker):
+    """
+    Test that a file is processed on a worker thread and not queued again while it is in flight.
+    """
+    monitor = FileMonitorHandler(mock.MagicMock(), max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    threads = []
+
+    def process_path(file_path):
+        threads.append(threading.current_thread().name)
+        started.set()
+        release.wait(timeout=5)
+
+    mocker.patch.object(monitor, "process_path", side_effect=process_path)
+
+    monitor.schedule_file("people.csv")
+    assert started.wait(timeout=5)
+    monitor.schedule_file("people.csv")
+    release.set()
+    monitor.close()
+
+    assert len(threads) == 1
+    assert threads[0].startswith("fetch")
+
+
+def test_process_path_parses_each_file_once(tmp_path, mocker):
+    """
+    Test that the logged preview comes from the handler's first chunk instead of a separate read.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\n" + "".join(f"user{i},{20 + i},Taipei\n" for i in range(100)))
+    read_csv = mocker.spy(pd, "read_csv")
+    db_handler = mock.MagicMock()
+    monitor = FileMonitorHandler(db_handler)
+    log_debug = mocker.patch.object(monitor.logger, "debug")
+
+    monitor.process_path(str(file_path))
+
+    assert read_csv.call_count == 1
+    db_handler.enqueue.assert_called_once()
+    log_debug.assert_called_once()
+    preview = log_debug.call_args.args[2]
+    assert "user9" in preview and "user10" not in preview
+
+
+def test_preview_is_not_formatted_above_debug_level(tmp_path, mocker):
+    """
+    Test that the file content is not rendered when debug logging is disabled.
+    """
+    monitor = FileMonitorHandler(mock.MagicMock())
+    mocker.patch.object(monitor.logger, "isEnabledFor", return_value=False)
+    df = mock.MagicMock()
+
+    monitor._log_preview("people.csv", df)
+
+    df.head.assert_not_called()
+
+
+def test_folder_monitor_runs_on_the_loop_that_starts_it(tmp_path):
+    """
+    Test that FolderMonitor binds to the loop running start_monitoring and shuts down when stopped.
+    """
+    db_handler = mock.MagicMock()
+    monitor = FolderMonitor(str(tmp_path), 1, db_handler, dry_run=True)
+    assert monitor.loop is None
+
+    async def run():
+        task = asyncio.ensure_future(monitor.start_monitoring())
+        await asyncio.sleep(0.2)
+        assert monitor.loop is asyncio.get_running_loop()
+        monitor.stop_monitoring()
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(run())
+
+    db_handler.close.assert_called_once()
+
+
+def test_handlers_are_created_once_per_worker_thread(tmp_path):
+    """
+    Test that a worker thread reuses its handler instance across files instead of creating one per file.
+    """
+    handler_class = mock.MagicMock()
+    monitor = FileMonitorHandler(mock.MagicMock(), file_handlers={".csv": handler_class},
+                                 dry_run=True)
+
+    monitor.process_path(str(tmp_path / "first.csv"))
+    monitor.process_path(str(tmp_path / "second.csv"))
+    other_thread = threading.Thread(target=monitor.process_path, args=(str(tmp_path / "third.csv"),))
+    other_thread.start()
+    other_thread.join()
+
+    assert handler_class.call_count == 2
+    assert handler_class.return_value.process_file_columnar.call_count == 3
+
+
+def test_unsupported_files_are_not_queued(tmp_path, mocker):
+    """
+    Test that files without a handled extension are dropped when detected, before any readiness polling.
+    """
+    monitor = FileMonitorHandler(mock.MagicMock())
+    schedule_file = mocker.patch.object(monitor, "schedule_file")
+
+    monitor.on_created(mock.MagicMock(is_directory=False, src_path=str(tmp_path / "notes.txt")))
+    monitor.on_created(mock.MagicMock(is_directory=False, src_path=str(tmp_path / "people.csv")))
+
+    schedule_file.assert_called_once_with(str(tmp_path / "people.csv"), check_ready=True)
+
+
+def test_row_validated_records_go_to_record_handlers_as_dicts(tmp_path):
+    """
+    Test that a database handler accepting records gets row-validated records without a DataFrame round-trip.
+    """
+    @dataclasses.dataclass
+    class Person:
+        name: str
+        age: int
+        city: str
+
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\nuser0,20,Taipei\n")
+    db_handler = mock.MagicMock(accepts_records=True)
+    monitor = FileMonitorHandler(db_handler,
+                                 file_handlers={".csv": functools.partial(CSVFetchHandler, Person)})
+
+    monitor.process_path(str(file_path))
+
+    db_handler.enqueue.assert_called_once_with([{"name": "user0", "age": 20, "city": "Taipei"}])
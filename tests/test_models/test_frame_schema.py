@@ -0,0 +1,166 @@
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from src.models.data_record import DataRecordCSV, DataRecordExcel
+from src.models.frame_schema import FrameSchema
+
+
+def test_validate_coerces_like_pydantic():
+    """
+    Test that valid rows are coerced to the model's field types and extra columns are dropped.
+    """
+    df = pd.DataFrame({"product": ["A", "B"], "price": [1, 2], "quantity": [10.0, "20"], "extra": [0, 0]})
+
+    valid, failures = FrameSchema.for_model(DataRecordExcel).validate(df)
+
+    assert valid.to_dict(orient="records") == [
+        DataRecordExcel(**row).model_dump() for row in df.to_dict(orient="records")
+    ]
+    assert failures.empty
+
+
+def test_validate_flags_invalid_fields():
+    """
+    Test that rows pydantic would reject are dropped and their failing fields reported.
+    """
+    df = pd.DataFrame({"name": ["user0", "user1", None], "age": [20, "unknown", 21.5], "city": ["Taipei"] * 3})
+
+    valid, failures = FrameSchema.for_model(DataRecordCSV).validate(df)
+
+    assert valid.to_dict(orient="records") == [{"name": "user0", "age": 20, "city": "Taipei"}]
+    assert failures.to_dict(orient="index") == {
+        1: {"name": False, "age": True, "city": False},
+        2: {"name": True, "age": True, "city": False},
+    }
+
+
+def test_for_model_rejects_unsupported_field_types():
+    """
+    Test that models with field types other than str, int and float fall back to row-wise validation.
+    """
+    class Tagged(BaseModel):
+        tags: list
+
+    class Bounded(BaseModel):
+        quantity: int = Field(ge=0)
+
+    assert FrameSchema.for_model(Tagged) is None
+    assert FrameSchema.for_model(Bounded) is None
+
+
+class Uppercased(BaseModel):
+    code: str
+
+    @field_validator('code')
+    @classmethod
+    def upper(cls, value):
+        return value.upper()
+
+
+class Strict(BaseModel):
+    model_config = ConfigDict(strict=True)
+    count: int
+
+
+class Closed(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    count: int
+
+
+class Aliased(BaseModel):
+    count: int = Field(alias='Count')
+
+
+@pytest.mark.parametrize("model", [Uppercased, Strict, Closed, Aliased],
+                         ids=["field_validator", "strict", "extra_forbid", "alias"])
+def test_for_model_rejects_models_with_custom_validation(model):
+    """
+    Test that models whose validators, config or aliases only pydantic applies get no column-wise schema.
+    """
+    assert FrameSchema.for_model(model) is None
+
+
+def test_string_dtype_columns_are_checked_from_their_dtype(mocker):
+    """
+    Test that Arrow-backed string columns are validated by their missing values without inspecting each value.
+    """
+    infer_dtype = mocker.spy(pd.api.types, "infer_dtype")
+    df = pd.DataFrame({
+        "name": pd.Series(["user0", None], dtype="string[pyarrow]"),
+        "age": [20, 21],
+        "city": pd.Series(["Taipei", "Taipei"], dtype="string[pyarrow]"),
+    })
+
+    valid, failures = FrameSchema.for_model(DataRecordCSV).validate(df)
+
+    infer_dtype.assert_not_called()
+    assert valid.to_dict(orient="records") == [{"name": "user0", "age": 20, "city": "Taipei"}]
+    assert failures.to_dict(orient="index") == {1: {"name": True, "age": False, "city": False}}
+
+
+class Measure(BaseModel):
+    count: int
+    amount: float
+
+
+def assert_matches_pydantic(df):
+    """
+    Asserts that FrameSchema keeps exactly the rows pydantic accepts, with the same values.
+    """
+    valid, failures = FrameSchema.for_model(Measure).validate(df)
+    expected = {}
+    for index, row in zip(df.index, df.to_dict(orient="records")):
+        try:
+            expected[index] = Measure(**row).model_dump()
+        except ValidationError:
+            pass
+
+    assert list(valid.index) == list(expected)
+    assert sorted(failures.index) == sorted(set(df.index) - set(expected))
+    assert repr(valid.to_dict(orient="records")) == repr(list(expected.values()))
+
+
+def test_validate_matches_pydantic_for_float_columns():
+    """
+    Test numeric columns: ints beyond int64 and NaN are rejected as ints, NaN is accepted as a float.
+    """
+    assert_matches_pydantic(pd.DataFrame({
+        "count": [1e20, 2.0, 2.5, float("nan"), 9.2e18, 2.0 ** 63],
+        "amount": [1.0, float("nan"), 2.0, 3.0, 4.0, 5.0],
+    }))
+
+
+def test_validate_matches_pydantic_for_string_columns():
+    """
+    Test object columns of text: exponents, underscores, nan spellings and empty cells.
+    """
+    assert_matches_pydantic(pd.DataFrame({
+        "count": ["1e3", "1_000", " 7 ", "1.0", "1.5", "9" * 18, "x", "12", "-3", "１２"],
+        "amount": ["1", "nan", "1_000", "abc", float("nan"), "1e3", " 1_0", "-inf", ".5", "1"],
+    }))
+
+
+def test_validate_rejects_int_text_beyond_int64():
+    """
+    Test that integers too large for the int64 column are flagged instead of overflowing.
+    """
+    df = pd.DataFrame({"count": ["9" * 30, "-9223372036854775808"], "amount": [1.0, 1.0]})
+
+    valid, failures = FrameSchema.for_model(Measure).validate(df)
+
+    assert valid["count"].tolist() == [-2 ** 63]
+    assert list(failures.index) == [0]
+
+
+def test_for_model_rejects_fields_with_defaults():
+    """
+    Test that models whose fields have defaults or default factories get no column-wise schema.
+    """
+    class Defaulted(BaseModel):
+        count: int = 0
+
+    class Generated(BaseModel):
+        count: int = Field(default_factory=int)
+
+    assert FrameSchema.for_model(Defaulted) is None
+    assert FrameSchema.for_model(Generated) is None
@@ -0,0 +1,188 @@
+import uuid
+from typing import List, Optional
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+from src.handlers.file_fetch_handlers.base_file_fetcher_handler import _validate_rows
+from src.models.row_validator import compile_row_validator
+
+
+class Reading(BaseModel):
+    sensor: str
+    value: float
+    count: int = 0
+    note: Optional[str] = None
+
+
+@pytest.mark.parametrize("record", [
+    {"sensor": "s1", "value": 1, "count": "3", "note": "ok"},
+    {"sensor": "s2", "value": " 2.5 ", "count": 4.0},
+    {"sensor": "s3", "value": 3.0, "note": None, "extra": 1},
+])
+def test_generated_validator_matches_pydantic(record):
+    """
+    Test that valid records produce the same dict as the pydantic model.
+    """
+    assert compile_row_validator(Reading)(record) == Reading(**record).model_dump()
+
+
+@pytest.mark.parametrize("record", [
+    {"value": 1.0},
+    {"sensor": 1, "value": 1.0},
+    {"sensor": "s1", "value": "high"},
+    {"sensor": "s1", "value": 1.0, "count": 1.5},
+])
+def test_generated_validator_rejects_what_pydantic_rejects(record):
+    """
+    Test that records pydantic rejects raise in the generated validator too.
+    """
+    with pytest.raises(ValidationError):
+        Reading(**record)
+    with pytest.raises((KeyError, TypeError, ValueError)):
+        compile_row_validator(Reading)(record)
+
+
+def test_unsupported_models_fall_back():
+    """
+    Test that models with field types the generator does not handle get no validator.
+    """
+    class Tagged(BaseModel):
+        tags: List[str]
+
+    assert compile_row_validator(Tagged) is None
+
+
+class Stock(BaseModel):
+    product: str
+    quantity: int = Field(ge=0)
+    price: Optional[float] = Field(None, gt=0, le=1000)
+
+
+@pytest.mark.parametrize("record, valid", [
+    ({"product": "A", "quantity": "0", "price": 9.5}, True),
+    ({"product": "A", "quantity": 1, "price": None}, True),
+    ({"product": "A", "quantity": 2}, True),
+    ({"product": "A", "quantity": -1, "price": 9.5}, False),
+    ({"product": "A", "quantity": 1, "price": 0}, False),
+    ({"product": "A", "quantity": 1, "price": 1000.5}, False),
+])
+def test_generated_validator_checks_bounds_like_pydantic(record, valid):
+    """
+    Test that ge/gt/le/lt field constraints are enforced as pydantic enforces them.
+    """
+    validate = compile_row_validator(Stock)
+    if valid:
+        assert validate(record) == Stock(**record).model_dump()
+    else:
+        with pytest.raises(ValidationError):
+            Stock(**record)
+        with pytest.raises(ValueError):
+            validate(record)
+
+
+class Uppercased(BaseModel):
+    code: str
+
+    @field_validator('code')
+    @classmethod
+    def upper(cls, value):
+        if value == 'bad':
+            raise ValueError('bad code')
+        return value.upper()
+
+
+class Checked(BaseModel):
+    low: int
+    high: int
+
+    @model_validator(mode='after')
+    def ordered(self):
+        if self.low > self.high:
+            raise ValueError('low above high')
+        return self
+
+
+class Strict(BaseModel):
+    model_config = ConfigDict(strict=True)
+    count: int
+
+
+class Closed(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    count: int
+
+
+class Aliased(BaseModel):
+    count: int = Field(alias='Count')
+
+
+@pytest.mark.parametrize("model, valid, invalid", [
+    (Uppercased, {"code": "ab"}, {"code": "bad"}),
+    (Checked, {"low": 1, "high": 2}, {"low": 3, "high": 2}),
+    (Strict, {"count": 5}, {"count": "5"}),
+    (Closed, {"count": 5}, {"count": 5, "other": 1}),
+    (Aliased, {"Count": 5}, {"count": 6}),
+], ids=["field_validator", "model_validator", "strict", "extra_forbid", "alias"])
+def test_models_with_custom_validation_fall_back_to_pydantic(model, valid, invalid):
+    """
+    Test that models with validators, a non-default config or aliases get no generated validator,
+    so rows are validated exactly as pydantic validates them.
+    """
+    assert compile_row_validator(model) is None
+    validated, errors, _ = _validate_rows(model, [valid, invalid])
+    assert validated == [model(**valid).model_dump()]
+    assert [record for record, _ in errors] == [invalid]
+
+
+class Number(BaseModel):
+    count: Optional[int] = None
+    amount: Optional[float] = None
+
+
+def assert_same_as_pydantic(record):
+    """
+    Asserts that the generated validator accepts the record with the same values as pydantic, or rejects it.
+    """
+    validate = compile_row_validator(Number)
+    try:
+        expected = Number(**record).model_dump()
+    except ValidationError:
+        with pytest.raises((TypeError, ValueError)):
+            validate(record)
+        return
+    assert repr(validate(record)) == repr(expected)
+
+
+@pytest.mark.parametrize("value", [
+    "1e3", "1_000", " 1_0 ", "_1", "1__0", "1.0", "1.00", "1.", ".0", "1.5", "1.0_0", "1_0.0", " +5 ", "-0",
+    "0x10", "１２", "nan", "inf", "", "  ", 1e20, 9.2e18, 2.0 ** 63, -2.0 ** 63, float("nan"), 3.0, True,
+    "9" * 30,
+])
+def test_int_conversion_matches_pydantic(value):
+    """
+    Test that strings and floats are accepted or rejected as int exactly as pydantic does.
+    """
+    assert_same_as_pydantic({"count": value})
+
+
+@pytest.mark.parametrize("value", [
+    "1e3", "1_000", "1_000.5", " 1_0", "_1", "1__0", "1_.0", " 12 ", ".5", "1.", "nan", " NaN", "-inf",
+    "Infinity", "0x10", "１.5", "", "1e400", float("nan"), 2 ** 70, True,
+])
+def test_float_conversion_matches_pydantic(value):
+    """
+    Test that strings and numbers are accepted or rejected as float exactly as pydantic does.
+    """
+    assert_same_as_pydantic({"amount": value})
+
+
+def test_default_factory_falls_back_to_pydantic():
+    """
+    Test that a default_factory is called for every row rather than once for all of them.
+    """
+    class Event(BaseModel):
+        rid: str = Field(default_factory=lambda: uuid.uuid4().hex)
+        name: str
+
+    assert compile_row_validator(Event) is None
+    validated, _, _ = _validate_rows(Event, [{"name": "a"}, {"name": "b"}])
+    assert validated[0]["rid"] != validated[1]["rid"]
@@ -0,0 +1,51 @@
+import os
+import time
+from src.utils.file_ready import wait_until_stable
+
+
+def test_old_file_is_ready_without_waiting(tmp_path):
+    """
+    Test that a file last written longer ago than the settle time is ready immediately.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\n")
+    past = time.time() - 10
+    os.utime(file_path, (past, past))
+
+    started = time.monotonic()
+    assert wait_until_stable(str(file_path), settle=5.0) is True
+    assert time.monotonic() - started < 1.0
+
+
+def test_file_still_changing_times_out(tmp_path, mocker):
+    """
+    Test that a file whose size keeps changing is reported as not ready once the timeout expires.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\n")
+    sizes = iter(range(1000))
+    real_stat = os.stat
+
+    def growing_stat(path):
+        st = real_stat(path)
+        return os.stat_result((st.st_mode, st.st_ino, st.st_dev, st.st_nlink, st.st_uid, st.st_gid,
+                               next(sizes), st.st_atime, time.time(), st.st_ctime))
+
+    mocker.patch("os.stat", side_effect=growing_stat)
+
+    assert wait_until_stable(str(file_path), settle=0.2, timeout=0.3, interval=0.05) is False
+
+
+def test_unchanged_file_is_polled_with_backoff(tmp_path, mocker):
+    """
+    Test that a fresh file is re-stat'ed at doubling intervals, capped by the remaining settle time.
+    """
+    file_path = tmp_path / "people.csv"
+    file_path.write_text("name,age,city\n")
+    clock = [1000.0]
+    mocker.patch("time.monotonic", side_effect=lambda: clock[0])
+    mocker.patch("time.time", side_effect=lambda: os.stat(file_path).st_mtime + clock[0] - 1000.0)
+    sleep = mocker.patch("time.sleep", side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+
+    assert wait_until_stable(str(file_path), settle=1.0, interval=0.05) is True
+    assert [round(call.args[0], 2) for call in sleep.call_args_list] == [0.05, 0.1, 0.2, 0.4, 0.25]
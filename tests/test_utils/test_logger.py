@@ -0,0 +1,12 @@
+from logging.handlers import QueueHandler
+from src.utils.logger import setup_logger
+
+
+def test_logger_only_enqueues_records():
+    """
+    Test that the application logger hands records to a queue instead of writing them itself.
+    """
+    logger = setup_logger()
+
+    assert setup_logger() is logger
+    assert [type(handler) for handler in logger.handlers] == [QueueHandler]